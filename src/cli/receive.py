@@ -15,6 +15,10 @@ from typing import Tuple
 
 from dctp.transport import Transport
 
+WRITE_BUFFER = 1 << 20  # userspace buffer of the output file
+FLUSH_INTERVAL = 0.5  # seconds; hand buffered output to the OS at least this often
+SYNC_EVERY = 4 << 20  # fdatasync after this many flushed bytes
+
 
 def _addr(s: str) -> Tuple[str, int]:
     """
@@ -36,6 +40,22 @@ def _addr(s: str) -> Tuple[str, int]:
     return host, p
 
 
+def _sync(f) -> None:
+    """
+    Push written bytes to stable storage and drop them from the page cache.
+
+    Uses fdatasync (no metadata flush) where available, fsync otherwise.
+
+    Args:
+        f: The binary output file.
+    """
+    f.flush()
+    fd = f.fileno()
+    getattr(os, "fdatasync", os.fsync)(fd)
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+
+
 def build_parser() -> argparse.ArgumentParser:
     """
     Build the argument parser for DCTP receiver.
@@ -89,7 +109,10 @@ def main(argv: list[str] | None = None) -> int:
     started = time.time()
 
     try:
-        with open(out_path, "wb") as f:
+        with open(out_path, "wb", buffering=WRITE_BUFFER) as f:
+            unflushed = 0  # bytes written since the last flush
+            unsynced = 0  # bytes flushed since the last sync
+            last_flush = time.monotonic()
             while True:
                 t.poll(25)
 
@@ -97,6 +120,19 @@ def main(argv: list[str] | None = None) -> int:
                 if chunk:
                     f.write(chunk)
                     total += len(chunk)
+                    unflushed += len(chunk)
+
+                # Flush once the link goes idle or data has waited long enough,
+                # so a slow stream still reaches the file promptly.
+                now = time.monotonic()
+                if unflushed and (not chunk or now - last_flush >= FLUSH_INTERVAL):
+                    f.flush()
+                    unsynced += unflushed
+                    unflushed = 0
+                    last_flush = now
+                    if unsynced >= SYNC_EVERY:
+                        _sync(f)
+                        unsynced = 0
 
     except KeyboardInterrupt:
         if args.verbose:
@@ -14,6 +14,9 @@ from typing import Tuple
 
 from dctp.transport import Transport
 
+SEND_BATCH = 64  # most packets handed to the transport in one call
+SLEEP_GUARD_NS = 200_000  # sleep only when the next deadline is further than this
+
 
 def _addr(s: str) -> Tuple[str, int]:
     """Parse HOST:PORT into a (host, port) tuple."""
@@ -89,22 +92,38 @@ def main(argv: list[str] | None = None) -> int:
         total_queued = 0
         num_packets = args.num_packets
         rate = args.rate
-        interval = 1.0 / rate
+        interval_ns = max(int(1e9 / rate), 1)
         started = time.time()
 
         print(f"[dctp-send] Sending {num_packets} packets at {rate} packets/sec")
 
         try:
-            for i in range(num_packets):
-                data = f"Packet {i+1}".encode()
-                accepted = t.send(data)
-                if accepted <= 0:
-                    t.poll(10)
-                    continue
+            # Packet i is due at start + i * interval. Every packet whose deadline
+            # has passed is sent in one batch; between deadlines, sleep unless
+            # the next one is too close for sleep() to hit it.
+            start_ns = time.monotonic_ns()
+            i = 0
+            while i < num_packets:
+                elapsed_ns = time.monotonic_ns() - start_ns
+                due = min(elapsed_ns // interval_ns + 1, num_packets) - i
+                if due > 0:
+                    msgs = [
+                        f"Packet {j+1}".encode()
+                        for j in range(i, i + min(due, SEND_BATCH))
+                    ]
+                    sent = t.send_batch(msgs)
+                    total_queued += sum(len(m) for m in msgs[:sent])
+                    if args.verbose:
+                        for j in range(i, i + sent):
+                            print(f"[dctp-send] Sent packet {j+1}/{num_packets}")
+                    i += sent
+                    if sent < len(msgs):
+                        t.poll(10)
+                        continue
                 t.poll(0)
-                if args.verbose:
-                    print(f"[dctp-send] Sent packet {i+1}/{num_packets}")
-                time.sleep(interval)
+                slack_ns = start_ns + i * interval_ns - time.monotonic_ns()
+                if slack_ns > SLEEP_GUARD_NS:
+                    time.sleep((slack_ns - SLEEP_GUARD_NS // 2) / 1e9)
         except KeyboardInterrupt:
             print("\n[dctp-send] interrupted; closing…", file=sys.stderr)
         finally:
@@ -127,6 +146,7 @@ def main(argv: list[str] | None = None) -> int:
                 "bytes_rx",
                 "frames_tx",
                 "frames_rx",
+                "frames_bad",
                 "acks_tx",
                 "acks_rx",
                 "sacks_tx",
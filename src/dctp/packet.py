@@ -3,18 +3,22 @@ A module defining the Packet data model for DCTP (Dual Channel Transport Protoco
 
 Classes:
     Packet: A class representing a DCTP frame in a unified way.
+    PacketPool: A free list of reusable Packet objects.
 """
 
 from __future__ import annotations
 
+import operator
 import struct
-from dataclasses import dataclass, field
-from typing import ClassVar, List
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import ClassVar, List, Sequence, Tuple
 
 from .types import ChannelType, PacketType, SackBlock
 
 BASE_FMT = "!BBIIHH"  # type, channel_type, seq, ts_send, len, checksum
 BASE_LEN = struct.calcsize(BASE_FMT)
+CK_OFFSET = BASE_LEN - 2  # checksum is the last base header field
 
 ACK_FMT = "!IHI"  # ack, rcv_wnd, ts_echo
 ACK_LEN = struct.calcsize(ACK_FMT)
@@ -24,9 +28,18 @@ SACK_HDR_LEN = struct.calcsize(SACK_HDR_FMT)
 
 MAX_PAYLOAD = 1400
 MAX_SACK_BLOCKS = 32
+DEFAULT_POOL_CAPACITY = 1024
 
+# Shared by every packet without SACK blocks; never mutated in place.
+_EMPTY_SACK: Tuple[SackBlock, ...] = ()
 
-@dataclass
+_BASE = struct.Struct(BASE_FMT)
+_ACK = struct.Struct(ACK_FMT)
+_SACK_HDR = struct.Struct(SACK_HDR_FMT)
+_CK = struct.Struct("!H")
+
+
+@dataclass(slots=True)
 class Packet:
     """
     A class representing a DCTP frame in a unified way.
@@ -36,15 +49,22 @@ class Packet:
         channel_type (ChannelType): Whether the channel is reliable.
         seq (int): Sequence number of the packet.
         ts_send (int): Timestamp when the packet was sent.
-        payload (bytes): Payload of the packet (empty for control frames).
+        payload (bytes): Payload of the packet (empty for control frames); a
+            memoryview into the frame for parsed DATA packets.
         ack (int): Cumulative ACK number (for ACK/SACK packets).
         rcv_wnd (int): Receive window size (for ACK/SACK packets).
         ts_echo (int): Echoed timestamp (for ACK/SACK packets).
-        sack (List[SackBlock]): List of SACK blocks (for SACK packets).
+        sack (Sequence[SackBlock]): SACK blocks (for SACK packets); empty packets
+            share one immutable empty tuple, so assign a new list instead of
+            appending.
 
     Methods:
-        to_bytes() -> bytes: Serialize the Packet into a wire frame.
+        to_bytes() -> bytearray: Serialize the Packet into a wire frame.
+        pack_into(buf: bytearray) -> int: Serialize a DATA Packet into `buf`.
+        data_of(seq, payload, ts_send, channel_type) -> Packet: Build a DATA packet.
+        ack_of(ack, ts_echo, rcv_wnd) -> Packet: Build an ACK packet.
         from_bytes(frame: bytes) -> Packet: Parse a wire frame into a Packet.
+        parse_feedback(frame: bytes) -> tuple: Parse an ACK/SACK frame's fields.
     """
 
     typ: PacketType
@@ -57,83 +77,203 @@ class Packet:
     ack: int = 0
     rcv_wnd: int = 0
     ts_echo: int = 0
-    sack: List[SackBlock] = field(default_factory=list)
+    sack: Sequence[SackBlock] = _EMPTY_SACK
 
     BASE_LEN: ClassVar[int] = BASE_LEN
     ACK_LEN: ClassVar[int] = ACK_LEN
     MAX_PAYLOAD: ClassVar[int] = MAX_PAYLOAD
     MAX_SACK_BLOCKS: ClassVar[int] = MAX_SACK_BLOCKS
 
-    def to_bytes(self) -> bytes:
+    def to_bytes(self) -> bytearray:
         """
         Serialize this Packet into a wire frame.
 
+        The frame is assembled in a single pre-sized buffer: header, ACK/SACK
+        extras and payload are written in place, so the payload is copied once.
+
         Returns:
-            bytes: The serialized wire frame.
+            bytearray: The serialized wire frame.
 
         Raises:
             ValueError: on invalid field ranges, illegal combinations, or overflow.
         """
-        _u8("type", int(self.typ))
-        _u8("channel_type", int(self.channel_type))
-        _u32("seq", self.seq)
-        _u32("ts_send", self.ts_send)
-
-        extras = b""
+        # PacketType/ChannelType are IntEnums, which struct packs directly.
+        typ = self.typ
+        extras_len = 0
 
-        if self.typ == PacketType.DATA:
+        if typ == PacketType.DATA:
             length = len(self.payload)
             if length > MAX_PAYLOAD:
                 raise ValueError(f"payload too large: {length} > {MAX_PAYLOAD}")
-            _u16("len", length)
 
-        elif self.typ == PacketType.ACK:
+        elif typ == PacketType.ACK:
             _ensure_no_payload(self.payload)
-            _u32("ack", self.ack)
-            _u16("rcv_wnd", self.rcv_wnd)
-            _u32("ts_echo", self.ts_echo)
-            extras = struct.pack(ACK_FMT, self.ack, self.rcv_wnd, self.ts_echo)
+            extras_len = ACK_LEN
             length = 0
 
-        elif self.typ == PacketType.SACK:
+        elif typ == PacketType.SACK:
             _ensure_no_payload(self.payload)
-            _u32("ack", self.ack)
-            _u16("rcv_wnd", self.rcv_wnd)
-            _u32("ts_echo", self.ts_echo)
-
             if len(self.sack) > MAX_SACK_BLOCKS:
                 raise ValueError(
                     f"too many SACK blocks: {len(self.sack)} > {MAX_SACK_BLOCKS}"
                 )
 
             for i, (start, end) in enumerate(self.sack):
-                _u32(f"sack[{i}].start", start)
-                _u32(f"sack[{i}].end", end)
                 if not (start < end):
                     raise ValueError(f"sack[{i}] invalid range: [{start}, {end})")
 
-            extras = struct.pack(ACK_FMT, self.ack, self.rcv_wnd, self.ts_echo)
-            extras += struct.pack(SACK_HDR_FMT, len(self.sack), 0)
-            for blk in self.sack:
-                extras += struct.pack("!II", blk.start, blk.end)
+            extras_len = ACK_LEN + SACK_HDR_LEN + 8 * len(self.sack)
             length = 0
 
         else:
             _ensure_no_payload(self.payload)
             length = 0
 
-        base_wo_ck = struct.pack(
-            BASE_FMT,
-            int(self.typ),
-            self.channel_type,
-            self.seq,
-            self.ts_send,
-            length,
-            0,
-        )
-        ck = _checksum(base_wo_ck + extras + self.payload)
-        base = base_wo_ck[:-2] + struct.pack("!H", ck)
-        return base + extras + self.payload
+        buf = bytearray(BASE_LEN + extras_len + length)
+        # struct rejects values that do not fit their field width, which covers
+        # the u8/u16/u32 range checks without a Python-level call per field.
+        try:
+            _BASE.pack_into(
+                buf,
+                0,
+                typ,
+                self.channel_type,
+                self.seq,
+                self.ts_send,
+                length,
+                0,
+            )
+
+            if extras_len:
+                _ACK.pack_into(buf, BASE_LEN, self.ack, self.rcv_wnd, self.ts_echo)
+            if typ == PacketType.SACK:
+                offs = BASE_LEN + ACK_LEN
+                _SACK_HDR.pack_into(buf, offs, len(self.sack), 0)
+                flat = [x for blk in self.sack for x in (blk.start, blk.end)]
+                _sack_struct(len(self.sack)).pack_into(buf, offs + SACK_HDR_LEN, *flat)
+        except struct.error as e:
+            raise ValueError(f"field out of range: {e}") from e
+
+        if length:
+            buf[BASE_LEN + extras_len :] = self.payload
+
+        _CK.pack_into(buf, CK_OFFSET, _checksum(buf))
+        return buf
+
+    def pack_into(self, buf: bytearray) -> int:
+        """
+        Serialize this DATA packet into the front of a reusable buffer.
+
+        Same wire format as to_bytes(), but nothing is allocated, so a sender can
+        push every DATA frame through one buffer.
+
+        Args:
+            buf (bytearray): Destination; at least BASE_LEN + MAX_PAYLOAD bytes.
+
+        Returns:
+            int: The frame length, i.e. the frame is buf[:n].
+
+        Raises:
+            ValueError: if the packet is not DATA, or on field overflow.
+        """
+        if self.typ != PacketType.DATA:
+            raise ValueError("pack_into only serializes DATA packets")
+        length = len(self.payload)
+        if length > MAX_PAYLOAD:
+            raise ValueError(f"payload too large: {length} > {MAX_PAYLOAD}")
+
+        try:
+            _BASE.pack_into(
+                buf, 0, self.typ, self.channel_type, self.seq, self.ts_send, length, 0
+            )
+        except struct.error as e:
+            raise ValueError(f"field out of range: {e}") from e
+
+        n = BASE_LEN + length
+        buf[BASE_LEN:n] = self.payload
+        _CK.pack_into(buf, CK_OFFSET, _checksum(memoryview(buf)[:n]))
+        return n
+
+    @classmethod
+    def data_of(
+        cls,
+        seq: int,
+        payload: bytes,
+        ts_send: int = 0,
+        channel_type: ChannelType = ChannelType.RELIABLE,
+    ) -> "Packet":
+        """
+        Build a DATA packet, setting the slots directly.
+
+        Args:
+            seq (int): Sequence number of the first payload byte.
+            payload (bytes): The payload (any bytes-like object).
+            ts_send (int): Send timestamp.
+            channel_type (ChannelType): The channel the packet travels on.
+
+        Returns:
+            Packet: The DATA packet.
+        """
+        return Packet.fill_data(cls.__new__(cls), seq, payload, ts_send, channel_type)
+
+    @staticmethod
+    def fill_data(
+        pkt: "Packet",
+        seq: int,
+        payload: bytes,
+        ts_send: int = 0,
+        channel_type: ChannelType = ChannelType.RELIABLE,
+    ) -> "Packet":
+        """
+        Overwrite every field of an existing Packet to make it a DATA packet.
+
+        Lets senders recycle Packets from a PacketPool; see data_of().
+
+        Args:
+            pkt (Packet): The Packet to fill; may be uninitialised (Packet.__new__).
+            seq (int): Sequence number of the first payload byte.
+            payload (bytes): The payload (any bytes-like object).
+            ts_send (int): Send timestamp.
+            channel_type (ChannelType): The channel the packet travels on.
+
+        Returns:
+            Packet: `pkt`, filled in.
+        """
+        pkt.typ = PacketType.DATA
+        pkt.channel_type = channel_type
+        pkt.seq = seq
+        pkt.ts_send = ts_send
+        pkt.payload = payload
+        pkt.ack = 0
+        pkt.rcv_wnd = 0
+        pkt.ts_echo = 0
+        pkt.sack = _EMPTY_SACK
+        return pkt
+
+    @classmethod
+    def ack_of(cls, ack: int, ts_echo: int = 0, rcv_wnd: int = 0) -> "Packet":
+        """
+        Build a cumulative ACK packet, setting the slots directly.
+
+        Args:
+            ack (int): Cumulative ACK number.
+            ts_echo (int): Echoed timestamp.
+            rcv_wnd (int): Advertised receive window.
+
+        Returns:
+            Packet: The ACK packet.
+        """
+        p = cls.__new__(cls)
+        p.typ = PacketType.ACK
+        p.channel_type = ChannelType.RELIABLE
+        p.seq = ack
+        p.ts_send = 0
+        p.payload = b""
+        p.ack = ack
+        p.rcv_wnd = rcv_wnd
+        p.ts_echo = ts_echo
+        p.sack = _EMPTY_SACK
+        return p
 
     @staticmethod
     def from_bytes(frame: bytes) -> "Packet":
@@ -146,217 +286,327 @@ class Packet:
         Returns:
             Packet: The parsed Packet object.
 
+        Raises:
+            ValueError: if the frame is malformed or checksum fails.
+        """
+        return Packet.fill_from_bytes(Packet.__new__(Packet), frame)
+
+    @staticmethod
+    def fill_from_bytes(pkt: "Packet", frame: bytes) -> "Packet":
+        """
+        Parse a wire frame into an existing Packet, overwriting all of its fields.
+
+        This lets callers recycle Packet objects (see PacketPool) instead of
+        allocating one per received frame. A DATA payload is a memoryview into
+        `frame`, so the frame must not be modified while the packet is in use.
+
+        Args:
+            pkt (Packet): The Packet to fill; may be uninitialised (Packet.__new__).
+            frame (bytes): The wire frame to parse.
+
+        Returns:
+            Packet: `pkt`, filled from the frame.
+
         Raises:
             ValueError: if the frame is malformed or checksum fails.
         """
         if len(frame) < BASE_LEN:
             raise ValueError(f"frame too short: {len(frame)} < {BASE_LEN}")
+        if frame[0] == PacketType.DATA:
+            return Packet._fill_data(pkt, frame)
 
-        typ_u8, channel_type_int, seq, ts_send, length, ck = struct.unpack(
-            BASE_FMT, frame[:BASE_LEN]
+        typ, channel_type_int, seq, ts_send, ack, rcv_wnd, ts_echo, sack_blocks = (
+            _parse_control(frame)
         )
-        try:
-            typ = PacketType(typ_u8)
-        except ValueError as e:
-            raise ValueError(f"unknown packet type: {typ_u8}") from e
+        pkt.typ = typ
+        pkt.channel_type = ChannelType(channel_type_int)
+        pkt.seq = seq
+        pkt.ts_send = ts_send
+        pkt.payload = b""
+        pkt.ack = ack
+        pkt.rcv_wnd = rcv_wnd
+        pkt.ts_echo = ts_echo
+        pkt.sack = sack_blocks
+        return pkt
 
-        offs = BASE_LEN
-        ack = 0
-        rcv_wnd = 0
-        ts_echo = 0
-        sack_blocks: List[SackBlock] = []
+    @staticmethod
+    def parse_feedback(
+        frame: bytes,
+    ) -> Tuple[PacketType, int, int, int, Sequence[SackBlock]]:
+        """
+        Parse and validate an ACK/SACK frame without building a Packet.
 
-        extras_len = 0
-        if typ == PacketType.DATA:
-            extras = b""
+        Args:
+            frame (bytes): The wire frame to parse.
 
-        elif typ == PacketType.ACK:
-            _require_at_least(frame, offs, ACK_LEN, "ACK section")
-            ack, rcv_wnd, ts_echo = struct.unpack(ACK_FMT, frame[offs : offs + ACK_LEN])
-            extras = frame[offs : offs + ACK_LEN]
-            offs += ACK_LEN
-            extras_len += ACK_LEN
-            if length != 0:
-                raise ValueError("ACK frame must have len == 0")
+        Returns:
+            Tuple[PacketType, int, int, int, Sequence[SackBlock]]: typ, ack,
+            rcv_wnd, ts_echo and the SACK blocks (empty for ACK).
 
-        elif typ == PacketType.SACK:
-            _require_at_least(frame, offs, ACK_LEN, "ACK section")
-            ack, rcv_wnd, ts_echo = struct.unpack(ACK_FMT, frame[offs : offs + ACK_LEN])
-            extras = frame[offs : offs + ACK_LEN]
-            offs += ACK_LEN
-            extras_len += ACK_LEN
-            if length != 0:
-                raise ValueError("SACK frame must have len == 0")
-
-            _require_at_least(frame, offs, SACK_HDR_LEN, "SACK header")
-            block_cnt, reserved = struct.unpack(
-                SACK_HDR_FMT, frame[offs : offs + SACK_HDR_LEN]
-            )
-            if reserved != 0:
-                raise ValueError("SACK reserved byte must be 0")
-            extras += frame[offs : offs + SACK_HDR_LEN]
-            offs += SACK_HDR_LEN
-            extras_len += SACK_HDR_LEN
+        Raises:
+            ValueError: if the frame is malformed, fails its checksum or is
+                not an ACK/SACK frame.
+        """
+        if len(frame) < BASE_LEN:
+            raise ValueError(f"frame too short: {len(frame)} < {BASE_LEN}")
+        if frame[0] != PacketType.ACK and frame[0] != PacketType.SACK:
+            raise ValueError(f"not a feedback frame: type {frame[0]}")
+        typ, _, _, _, ack, rcv_wnd, ts_echo, sack_blocks = _parse_control(frame)
+        return typ, ack, rcv_wnd, ts_echo, sack_blocks
 
-            if block_cnt > MAX_SACK_BLOCKS:
-                raise ValueError(
-                    f"SACK block_cnt too large: {block_cnt} > {MAX_SACK_BLOCKS}"
-                )
+    @staticmethod
+    def _fill_data(pkt: "Packet", frame: bytes) -> "Packet":
+        """
+        Fast path of fill_from_bytes for DATA frames, the bulk of all traffic.
 
-            need = block_cnt * 8
-            _require_at_least(frame, offs, need, "SACK blocks")
-            for i in range(block_cnt):
-                start, end = struct.unpack(
-                    "!II", frame[offs + 8 * i : offs + 8 * (i + 1)]
-                )
-                if not (start < end):
-                    raise ValueError(f"SACK block {i} invalid range: [{start}, {end})")
-                sack_blocks.append(SackBlock(start, end))
-            extras += frame[offs : offs + need]
-            offs += need
-            extras_len += need
+        DATA frames carry no ACK/SACK section, so this is one header unpack, one
+        length check and one checksum, with none of the control-frame branches.
 
-        else:
-            extras = b""
-            if length != 0:
-                raise ValueError("CTRL frame must have len == 0")
+        Args:
+            pkt (Packet): The Packet to fill.
+            frame (bytes): A wire frame whose type byte is DATA.
+
+        Returns:
+            Packet: `pkt`, filled from the frame.
 
-        expected_total = BASE_LEN + extras_len + length
-        if len(frame) != expected_total:
+        Raises:
+            ValueError: if the frame is malformed or checksum fails.
+        """
+        _, channel_type_int, seq, ts_send, length, _ck = _BASE.unpack_from(frame, 0)
+        if len(frame) != BASE_LEN + length:
             raise ValueError(
-                f"length mismatch: header len={length}, extras={extras_len}, "
-                f"total expected={expected_total}, actual={len(frame)}"
+                f"length mismatch: header len={length}, extras=0, "
+                f"total expected={BASE_LEN + length}, actual={len(frame)}"
             )
+        if _checksum(frame) != 0:
+            raise ValueError("checksum mismatch")
 
-        payload = frame[-length:] if length else b""
+        pkt.typ = PacketType.DATA
+        pkt.channel_type = ChannelType(channel_type_int)
+        pkt.seq = seq
+        pkt.ts_send = ts_send
+        # A view, not a copy: consumers copy the bytes once where they keep them.
+        pkt.payload = memoryview(frame)[BASE_LEN:] if length else b""
+        pkt.ack = 0
+        pkt.rcv_wnd = 0
+        pkt.ts_echo = 0
+        pkt.sack = _EMPTY_SACK
+        return pkt
 
-        base_wo_ck = struct.pack(
-            BASE_FMT, typ_u8, channel_type_int, seq, ts_send, length, 0
-        )
-        expected_ck = _checksum(base_wo_ck + extras + payload)
-        if ck != expected_ck:
-            raise ValueError("checksum mismatch")
 
-        return Packet(
-            typ=typ,
-            channel_type=ChannelType(channel_type_int),
-            seq=seq,
-            ts_send=ts_send,
-            payload=payload,
-            ack=ack,
-            rcv_wnd=rcv_wnd,
-            ts_echo=ts_echo,
-            sack=sack_blocks,
-        )
+class PacketPool:
+    """
+    A free list of Packet objects reused across received frames.
 
+    Borrow with get(), fill it (Packet.fill_from_bytes), and give it back with
+    put() once nothing refers to it any more. At most `capacity` idle packets
+    are kept; extra ones are left to the garbage collector.
 
-def _checksum(b: bytes) -> int:
+    Methods:
+        get() -> Packet: Take an idle Packet (uninitialised if newly created).
+        put(pkt: Packet) -> None: Return a Packet to the pool.
     """
-    Compute 16-bit internet checksum (one's complement sum over 16-bit words).
 
-    If `b` has odd length, a trailing zero byte is added for summation only.
+    __slots__ = ("_free", "capacity")
 
-    Args:
-        b (bytes): The byte sequence to checksum.
+    def __init__(self, capacity: int = DEFAULT_POOL_CAPACITY):
+        self._free: List[Packet] = []
+        self.capacity = int(capacity)
 
-    Returns:
-        int: The computed checksum as a 16-bit integer.
-    """
-    total = 0
-    if len(b) % 2 == 1:
-        b += b"\x00"
-    for i in range(0, len(b), 2):
-        total += (b[i] << 8) | (b[i + 1])
-        total = (total & 0xFFFF) + (total >> 16)
-    return (~total) & 0xFFFF
+    def get(self) -> Packet:
+        """
+        Take an idle Packet from the pool, or create an uninitialised one.
+
+        Returns:
+            Packet: A Packet whose fields must all be set before use.
+        """
+        return self._free.pop() if self._free else Packet.__new__(Packet)
 
+    def put(self, pkt: Packet) -> None:
+        """
+        Return a Packet to the pool, dropping its payload reference.
 
-def _ensure_no_payload(payload: bytes) -> None:
+        Args:
+            pkt (Packet): The Packet to recycle.
+
+        Returns:
+            None
+        """
+        if len(self._free) < self.capacity:
+            pkt.payload = b""
+            self._free.append(pkt)
+
+
+def _parse_control(
+    frame: bytes,
+) -> Tuple[PacketType, int, int, int, int, int, int, Sequence[SackBlock]]:
     """
-    Ensure that control frames have no payload.
+    Parse and validate a non-DATA frame of at least BASE_LEN bytes.
 
     Args:
-        payload (bytes): The payload to check.
+        frame (bytes): The wire frame to parse.
 
     Returns:
-        None
+        Tuple[PacketType, int, int, int, int, int, int, Sequence[SackBlock]]:
+        typ, channel_type, seq, ts_send, ack, rcv_wnd, ts_echo and SACK blocks.
 
     Raises:
-        ValueError: if the payload is not empty.
+        ValueError: if the frame is malformed or checksum fails.
     """
-    if payload:
-        raise ValueError("control frames (ACK/SACK/CTRL) must have len == 0 payload")
+    typ_u8, channel_type_int, seq, ts_send, length, _ck = _BASE.unpack_from(frame, 0)
+    try:
+        typ = PacketType(typ_u8)
+    except ValueError as e:
+        raise ValueError(f"unknown packet type: {typ_u8}") from e
+
+    offs = BASE_LEN
+    ack = 0
+    rcv_wnd = 0
+    ts_echo = 0
+    sack_blocks: List[SackBlock] = []
+
+    extras_len = 0
+    if typ == PacketType.ACK:
+        _require_at_least(frame, offs, ACK_LEN, "ACK section")
+        ack, rcv_wnd, ts_echo = _ACK.unpack_from(frame, offs)
+        offs += ACK_LEN
+        extras_len += ACK_LEN
+        if length != 0:
+            raise ValueError("ACK frame must have len == 0")
+
+    elif typ == PacketType.SACK:
+        _require_at_least(frame, offs, ACK_LEN, "ACK section")
+        ack, rcv_wnd, ts_echo = _ACK.unpack_from(frame, offs)
+        offs += ACK_LEN
+        extras_len += ACK_LEN
+        if length != 0:
+            raise ValueError("SACK frame must have len == 0")
+
+        _require_at_least(frame, offs, SACK_HDR_LEN, "SACK header")
+        block_cnt, reserved = _SACK_HDR.unpack_from(frame, offs)
+        if reserved != 0:
+            raise ValueError("SACK reserved byte must be 0")
+        offs += SACK_HDR_LEN
+        extras_len += SACK_HDR_LEN
+
+        if block_cnt > MAX_SACK_BLOCKS:
+            raise ValueError(
+                f"SACK block_cnt too large: {block_cnt} > {MAX_SACK_BLOCKS}"
+            )
 
+        need = block_cnt * 8
+        _require_at_least(frame, offs, need, "SACK blocks")
+        # One unpack for all blocks; validation and SackBlock construction then
+        # run through C-level map() over the strided start/end columns.
+        flat = _sack_struct(block_cnt).unpack_from(frame, offs)
+        starts, ends = flat[0::2], flat[1::2]
+        if not all(map(operator.lt, starts, ends)):
+            i = next(i for i in range(block_cnt) if not starts[i] < ends[i])
+            raise ValueError(f"SACK block {i} invalid range: [{starts[i]}, {ends[i]})")
+        sack_blocks = list(map(SackBlock, starts, ends))
+        offs += need
+        extras_len += need
+
+    elif typ == PacketType.CTRL:
+        if length != 0:
+            raise ValueError("CTRL frame must have len == 0")
+
+    expected_total = BASE_LEN + extras_len + length
+    if len(frame) != expected_total:
+        raise ValueError(
+            f"length mismatch: header len={length}, extras={extras_len}, "
+            f"total expected={expected_total}, actual={len(frame)}"
+        )
 
-def _require_at_least(buf: bytes, start: int, need: int, what: str) -> None:
+    # Summing the frame with its stored checksum included yields 0xFFFF when
+    # intact (RFC 1071), so verify in place instead of rebuilding the frame.
+    if _checksum(frame) != 0:
+        raise ValueError("checksum mismatch")
+
+    return (
+        typ,
+        channel_type_int,
+        seq,
+        ts_send,
+        ack,
+        rcv_wnd,
+        ts_echo,
+        sack_blocks or _EMPTY_SACK,
+    )
+
+
+@lru_cache(maxsize=MAX_SACK_BLOCKS + 1)
+def _sack_struct(n: int) -> struct.Struct:
     """
-    Ensure that buf[start:] has at least `need` bytes.
+    Return a compiled Struct for `n` consecutive (start, end) SACK block pairs.
 
     Args:
-        buf (bytes): The buffer to check.
-        start (int): The starting index.
-        need (int): The number of bytes needed.
-        what (str): Description of the section being checked.
+        n (int): The number of SACK blocks.
 
     Returns:
-        None
-
-    Raises:
-        ValueError: if there are not enough bytes.
+        struct.Struct: A Struct packing/unpacking 2*n big-endian u32 values.
     """
-    if len(buf) - start < need:
-        raise ValueError(f"truncated {what}: need {need}, have {len(buf) - start}")
+    return struct.Struct("!" + "II" * n)
 
 
-def _u8(name: str, v: int) -> None:
+def _checksum(b: bytes) -> int:
     """
-    Ensure that `v` fits in an unsigned 8-bit integer.
+    Compute 16-bit internet checksum (one's complement sum over 16-bit words).
+
+    If `b` has odd length, a trailing zero byte is added for summation only
+    (as a shift of the accumulated value, without copying the buffer).
+
+    The sum is taken over the whole buffer at once: read as one big-endian
+    integer, every 16-bit word carries weight 2^16k, and 2^16 == 1 (mod 0xFFFF),
+    so the end-around-carry sum of the words is that integer modulo 0xFFFF
+    (mapped into 1..0xFFFF unless every word is zero).
 
     Args:
-        name (str): The name of the variable.
-        v (int): The value to check.
+        b (bytes): The byte sequence to checksum (any bytes-like object).
 
     Returns:
-        None
-
-    Raises:
-        ValueError: if `v` is out of range.
+        int: The computed checksum as a 16-bit integer.
     """
-    if not (0 <= v <= 0xFF):
-        raise ValueError(f"{name} out of range for u8: {v}")
+    total = int.from_bytes(b, "big")
+    if len(b) % 2 == 1:
+        total <<= 8
+    if total:
+        total = (total - 1) % 0xFFFF + 1
+    return (~total) & 0xFFFF
 
 
-def _u16(name: str, v: int) -> None:
+def _ensure_no_payload(payload: bytes) -> None:
     """
-    Ensure that `v` fits in an unsigned 16-bit integer.
+    Ensure that control frames have no payload.
 
     Args:
-        name (str): The name of the variable.
-        v (int): The value to check.
+        payload (bytes): The payload to check.
 
     Returns:
         None
 
     Raises:
-        ValueError: if `v` is out of range.
+        ValueError: if the payload is not empty.
     """
-    if not (0 <= v <= 0xFFFF):
-        raise ValueError(f"{name} out of range for u16: {v}")
+    if payload:
+        raise ValueError("control frames (ACK/SACK/CTRL) must have len == 0 payload")
 
 
-def _u32(name: str, v: int) -> None:
+def _require_at_least(buf: bytes, start: int, need: int, what: str) -> None:
     """
-    Ensure that `v` fits in an unsigned 32-bit integer.
+    Ensure that buf[start:] has at least `need` bytes.
 
     Args:
-        name (str): The name of the variable.
-        v (int): The value to check.
+        buf (bytes): The buffer to check.
+        start (int): The starting index.
+        need (int): The number of bytes needed.
+        what (str): Description of the section being checked.
 
     Returns:
         None
 
     Raises:
-        ValueError: if `v` is out of range.
+        ValueError: if there are not enough bytes.
     """
-    if not (0 <= v <= 0xFFFFFFFF):
-        raise ValueError(f"{name} out of range for u32: {v}")
+    if len(buf) - start < need:
+        raise ValueError(f"truncated {what}: need {need}, have {len(buf) - start}")
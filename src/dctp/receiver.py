@@ -2,16 +2,189 @@
 A module implementing the Receiver for DCTP (Dual Channel Transport Protocol).
 
 Classes:
+    Assembler: Sorted, disjoint byte ranges of buffered out-of-order data.
+    Ring: A power-of-two byte ring addressed by offset from its head.
     Receiver: A class that implements the receiver side of DCTP.
 """
 
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from operator import itemgetter
+from typing import Callable, List, Optional, Tuple
 
 from .packet import Packet
-from .types import ChannelType, PacketType, SackBlock
+from .types import MAX_SPAN_WINDOWS, ChannelType, PacketType, SackBlock
+
+__all__ = ["Assembler", "Receiver", "Ring"]
+
+MAX_SACK_REPORT = 4  # SACK blocks reported per feedback packet, highest first
+
+_PKT_DATA = PacketType.DATA
+_PKT_ACK = PacketType.ACK
+_PKT_SACK = PacketType.SACK
+_CH_REL = ChannelType.RELIABLE
+_CH_UNREL = ChannelType.UNRELIABLE
+
+_start_of = itemgetter(0)
+_end_of = itemgetter(1)
+
+
+class Assembler:
+    """
+    Sorted, disjoint, non-adjacent byte ranges [start, end) of buffered data.
+
+    Ranges are absolute stream offsets, so advancing rcv_nxt never rewrites
+    them. Their number is bounded by the reassembly buffer, not capped here.
+
+    Methods:
+        add(start: int, end: int) -> None: Merge a range in.
+        pop_through(pos: int) -> int: Drop ranges starting at or before `pos`.
+    """
+
+    __slots__ = ("ranges",)
+
+    def __init__(self):
+        self.ranges: List[Tuple[int, int]] = []
+
+    def add(self, start: int, end: int) -> None:
+        """
+        Merge [start, end) with every range it overlaps or touches.
+
+        Args:
+            start (int): First byte offset of the range.
+            end (int): One past the last byte offset of the range.
+
+        Returns:
+            None
+        """
+        r = self.ranges
+        # r[lo:hi] are the ranges that overlap or touch [start, end).
+        lo = bisect_left(r, start, key=_end_of)
+        hi = bisect_right(r, end, lo, key=_start_of)
+        if lo == hi:
+            r.insert(lo, (start, end))
+        else:
+            r[lo:hi] = [(min(start, r[lo][0]), max(end, r[hi - 1][1]))]
+
+    def pop_through(self, pos: int) -> int:
+        """
+        Remove the ranges that start at or before `pos`.
+
+        Args:
+            pos (int): Stream offset, normally rcv_nxt.
+
+        Returns:
+            int: The furthest end among the removed ranges, at least `pos`.
+        """
+        r = self.ranges
+        k = bisect_right(r, pos, key=_start_of)
+        if not k:
+            return pos
+        end = max(pos, r[k - 1][1])
+        del r[:k]
+        return end
+
+
+class Ring:
+    """
+    A byte ring whose head holds the next stream byte to deliver.
+
+    The capacity is rounded up to a power of two so positions wrap with a mask
+    instead of a modulo. Callers address it by offset from the head and must
+    reserve() room before writing past the capacity.
+
+    Methods:
+        reserve(size: int) -> None: Grow the capacity to at least `size`.
+        write_at(off: int, data: bytes) -> None: Store bytes at head + off.
+        drain_into(dst: bytearray, n: int) -> None: Move n bytes from the head.
+        advance(n: int) -> None: Skip n bytes at the head.
+    """
+
+    __slots__ = ("buf", "cap", "mask", "head")
+
+    def __init__(self, size: int):
+        cap = 1 << max(int(size) - 1, 0).bit_length()
+        self.buf = bytearray(cap)
+        self.cap = cap
+        self.mask = cap - 1
+        self.head = 0
+
+    def reserve(self, size: int) -> None:
+        """
+        Grow the ring to hold at least `size` bytes, keeping its contents.
+
+        The contents are unrolled so the head moves to slot 0 of the new buffer.
+
+        Args:
+            size (int): The capacity needed, in bytes.
+
+        Returns:
+            None
+        """
+        if size <= self.cap:
+            return
+        cap = 1 << (int(size) - 1).bit_length()
+        buf = bytearray(cap)
+        head = self.head
+        tail = self.cap - head
+        buf[:tail] = self.buf[head:]
+        buf[tail : self.cap] = self.buf[:head]
+        self.buf = buf
+        self.cap = cap
+        self.mask = cap - 1
+        self.head = 0
+
+    def write_at(self, off: int, data: bytes) -> None:
+        """
+        Copy `data` into the ring at `off` bytes past the head, wrapping at the end.
+
+        Args:
+            off (int): Offset from the head; off + len(data) must not exceed cap.
+            data (bytes): The bytes to store.
+
+        Returns:
+            None
+        """
+        i = (self.head + off) & self.mask
+        n = len(data)
+        first = min(n, self.cap - i)
+        mv = memoryview(data)
+        self.buf[i : i + first] = mv[:first]
+        if first < n:
+            self.buf[: n - first] = mv[first:]
+
+    def drain_into(self, dst: bytearray, n: int) -> None:
+        """
+        Append the `n` bytes at the head to `dst` and advance past them.
+
+        Args:
+            dst (bytearray): Where to append the bytes.
+            n (int): Number of bytes; at most cap.
+
+        Returns:
+            None
+        """
+        start = self.head
+        first = min(n, self.cap - start)
+        mv = memoryview(self.buf)
+        dst.extend(mv[start : start + first])
+        if first < n:
+            dst.extend(mv[: n - first])
+        self.head = (start + n) & self.mask
+
+    def advance(self, n: int) -> None:
+        """
+        Move the head `n` bytes forward without reading them.
+
+        Args:
+            n (int): Number of bytes to skip.
+
+        Returns:
+            None
+        """
+        self.head = (self.head + n) & self.mask
 
 
 @dataclass
@@ -19,6 +192,12 @@ class Receiver:
     """
     A class that implements the receiver side of DCTP.
 
+    Out-of-order reliable data is reassembled in a Ring whose head holds byte
+    `rcv_nxt`; an Assembler records which ranges of it are filled. The ring
+    starts at `wnd_bytes` and grows to buffer up to MAX_SPAN_WINDOWS windows
+    past `rcv_nxt`, as far as the sender may run ahead after SACKs. Feedback
+    reports at most MAX_SACK_REPORT of those ranges, the highest first.
+
     Attributes:
         rcv_nxt:   next in-order byte expected (cumulative ack point)
         wnd_bytes: advertised receive window (bytes)
@@ -29,123 +208,230 @@ class Receiver:
     wnd_bytes: int = 64 * 1024 - 1
     sack_enabled: bool = True
     verbose: bool = False
-    _buf: Dict[int, bytes] = field(default_factory=dict)
+    _ring: Ring = field(init=False, repr=False)
+    _ingest_table: List[List[Optional[Callable[[Packet], None]]]] = field(
+        init=False, repr=False
+    )
+    _asm: Assembler = field(default_factory=Assembler, init=False, repr=False)
+    _ack_pending: bool = field(default=False, init=False, repr=False)
+    _ack_ts_echo: int = field(default=0, init=False, repr=False)
+    _ack_pkt: Packet = field(init=False, repr=False)
+    _sack_pkt: Packet = field(init=False, repr=False)
     _delivered: bytearray = field(default_factory=bytearray)
     total_packets_received: int = 0  # total number of DATA packets received
 
+    def __post_init__(self) -> None:
+        """Allocate the reassembly ring and feedback packets once for the session."""
+        self._ring = Ring(max(self.wnd_bytes, 1))
+        # ingest() handlers indexed by [packet type][channel type]; None rejects.
+        self._ingest_table = [
+            [None] * len(ChannelType) for _ in range(max(PacketType) + 1)
+        ]
+        self._ingest_table[_PKT_DATA][_CH_UNREL] = self._ingest_unreliable
+        self._ingest_table[_PKT_DATA][_CH_REL] = self._ingest_reliable
+        self._ack_pkt = Packet(
+            typ=_PKT_ACK, channel_type=_CH_REL, seq=0, ts_send=0, payload=b""
+        )
+        self._sack_pkt = Packet(
+            typ=_PKT_SACK, channel_type=_CH_REL, seq=0, ts_send=0, payload=b""
+        )
+
     def on_data(self, pkt: Packet) -> Optional[Packet]:
         """
         Process an incoming DATA packet and return an ACK/SACK packet as feedback.
 
+        Equivalent to ingest() followed by drain_ack(); callers handling bursts
+        should use those directly to send one ACK/SACK per burst.
+
         Args:
             pkt (Packet): The incoming DATA packet.
 
         Returns:
             Optional[Packet]: An ACK or SACK packet to send back as feedback, or None for
-            unreliable packets.
+            unreliable packets. The receiver reuses the packet object, so it is
+            only valid until the next call; copy it to keep it longer.
+        """
+        self.ingest(pkt)
+        if pkt.channel_type == _CH_UNREL:
+            return None
+        return self.drain_ack()
+
+    def ingest(self, pkt: Packet) -> None:
+        """
+        Process an incoming DATA packet without building feedback for it.
+
+        Reliable packets leave an ACK/SACK pending for drain_ack().
+
+        Args:
+            pkt (Packet): The incoming DATA packet.
+
+        Returns:
+            None
         """
-        if pkt.typ != PacketType.DATA:
-            raise ValueError("Receiver.on_data expects DATA packets")
+        try:
+            handler = self._ingest_table[pkt.typ][pkt.channel_type]
+        except IndexError:
+            handler = None
+        if handler is None:
+            raise ValueError("Receiver.ingest expects DATA packets")
         self.total_packets_received += 1
-        self._print(
-            f"Got DATA packet | seq={pkt.seq} | len={len(pkt.payload or b'')} | "
-            f"ch={pkt.channel_type.name} | ts={pkt.ts_send} | msg={pkt.payload or b''}"
-        )
+        if self.verbose:
+            self._print(
+                f"Got DATA packet | seq={pkt.seq} | len={len(pkt.payload or b'')} | "
+                f"ch={pkt.channel_type.name} | ts={pkt.ts_send} | "
+                f"msg={bytes(pkt.payload)}"
+            )
+        handler(pkt)
 
-        if pkt.channel_type == ChannelType.UNRELIABLE:
-            if pkt.payload:
-                self._delivered.extend(pkt.payload)
-            return None
+    def _ingest_unreliable(self, pkt: Packet) -> None:
+        """
+        Deliver an UNRELIABLE DATA packet as is; it is never acknowledged.
+
+        Args:
+            pkt (Packet): The incoming DATA packet.
+
+        Returns:
+            None
+        """
+        if pkt.payload:
+            self._delivered.extend(pkt.payload)
+
+    def _ingest_reliable(self, pkt: Packet) -> None:
+        """
+        Reassemble a RELIABLE DATA packet and leave an ACK/SACK pending.
+
+        Args:
+            pkt (Packet): The incoming DATA packet.
+
+        Returns:
+            None
+        """
+        self._ack_pending = True
+        self._ack_ts_echo = pkt.ts_send
 
         seq = pkt.seq
         pay = pkt.payload or b""
 
-        if seq > self.rcv_nxt:
+        if self.verbose and seq > self.rcv_nxt:
             self._print(
                 f"OUT-OF-ORDER: got [{seq},{seq+len(pay)}) expecting {self.rcv_nxt}"
             )
 
         # Duplicate entirely before rcv_nxt
         if seq + len(pay) <= self.rcv_nxt:
-            return self._feedback(ts_echo=pkt.ts_send)
+            return
 
         # Trim left overlap to unseen portion
         if seq < self.rcv_nxt:
             trim = self.rcv_nxt - seq
-            if trim < len(pay):
-                pay = pay[trim:]
-                seq = self.rcv_nxt
-            else:
-                return self._feedback(ts_echo=pkt.ts_send)
+            if trim >= len(pay):
+                return
+            pay = pay[trim:]
+            seq = self.rcv_nxt
+
+        # In order: deliver straight from the packet without staging it in the
+        # ring, then append whatever buffered run it joins up with in one go.
+        if seq == self.rcv_nxt:
+            self._delivered.extend(pay)
+            self.rcv_nxt += len(pay)
+            self._ring.advance(len(pay))
+            if self._asm.ranges:
+                self._consume_contiguous()
+            return
+
+        # Drop segments beyond what the sender may have outstanding; it will
+        # retransmit them. They are not trimmed: the sender treats any SACKed
+        # overlap as acked.
+        off = seq - self.rcv_nxt
+        end = off + len(pay)
+        if end > self._ring.cap:
+            if end > max(self.wnd_bytes, 1) * MAX_SPAN_WINDOWS:
+                return
+            self._ring.reserve(end)
 
         if pay:
-            self._buf[seq] = pay
+            self._asm.add(seq, seq + len(pay))
+            self._ring.write_at(off, pay)
 
-        self._consume_contiguous()
+    def drain_ack(self) -> Optional[Packet]:
+        """
+        Return one ACK/SACK covering all reliable data ingested since the last
+        call, echoing the newest timestamp.
 
-        return self._feedback(ts_echo=pkt.ts_send)
+        Returns:
+            Optional[Packet]: The feedback packet, or None if nothing is pending.
+            The packet object is reused, so it is only valid until the next
+            call; copy it to keep it longer.
+        """
+        if not self._ack_pending:
+            return None
+        self._ack_pending = False
+        return self._feedback(ts_echo=self._ack_ts_echo)
 
-    def pop_deliverable(self) -> bytes:
+    def pop_deliverable(self, max_bytes: Optional[int] = None) -> bytes:
         """
         Return app-deliverable bytes since last call (may be empty).
 
+        Args:
+            max_bytes (Optional[int]): Return at most this many bytes; the rest
+                stay queued for the next call. None returns everything.
+
         Returns:
             bytes: Deliverable bytes.
         """
-        if not self._delivered:
+        buf = self._delivered
+        if not buf:
+            return b""
+        if max_bytes is None or max_bytes >= len(buf):
+            out = bytes(buf)
+            buf.clear()
+            return out
+        if max_bytes <= 0:
             return b""
-        out = bytes(self._delivered)
-        self._delivered.clear()
+        out = bytes(memoryview(buf)[:max_bytes])
+        del buf[:max_bytes]  # bytearray drops a prefix without moving the rest
         return out
 
     def _consume_contiguous(self) -> None:
         """
-        Greedily deliver any chunks that start exactly at rcv_nxt.
+        Deliver the buffered bytes that now follow on from rcv_nxt.
 
         Returns:
             None
         """
-        while True:
-            chunk = self._buf.pop(self.rcv_nxt, None)
-            if chunk is None:
-                return
-            self._delivered.extend(chunk)
-            self.rcv_nxt += len(chunk)
+        end = self._asm.pop_through(self.rcv_nxt)
+        run = end - self.rcv_nxt
+        if not run:
+            return
+
+        self._ring.drain_into(self._delivered, run)
+        self.rcv_nxt = end
 
     def _feedback(self, ts_echo: int) -> Packet:
         """
         Build ACK or SACK depending on buffered gaps.
         channel_type for feedback is marked RELIABLE.
 
+        The receiver owns one ACK and one SACK packet and refills them on every
+        call, so a returned packet is only valid until the next feedback is
+        built; copy it to keep it longer.
+
         Args:
             ts_echo (int): Timestamp to echo back.
 
         Returns:
             Packet: ACK or SACK packet.
         """
-        blocks = self._build_sack_blocks(limit=4)
-        if blocks and self.sack_enabled:
-            return Packet(
-                typ=PacketType.SACK,
-                channel_type=ChannelType.RELIABLE,
-                seq=self.rcv_nxt,
-                ts_send=0,
-                ack=self.rcv_nxt,
-                rcv_wnd=self.wnd_bytes,
-                ts_echo=ts_echo,
-                sack=blocks,
-                payload=b"",
-            )
-        return Packet(
-            typ=PacketType.ACK,
-            channel_type=ChannelType.RELIABLE,
-            seq=self.rcv_nxt,
-            ts_send=0,
-            ack=self.rcv_nxt,
-            rcv_wnd=self.wnd_bytes,
-            ts_echo=ts_echo,
-            payload=b"",
-        )
+        blocks = self._build_sack_blocks(limit=MAX_SACK_REPORT)
+        if blocks:
+            pkt = self._sack_pkt
+            pkt.sack = blocks
+        else:
+            pkt = self._ack_pkt
+        pkt.seq = pkt.ack = self.rcv_nxt
+        pkt.rcv_wnd = self.wnd_bytes
+        pkt.ts_echo = ts_echo
+        return pkt
 
     def _build_sack_blocks(self, limit: int) -> List[SackBlock]:
         """
@@ -155,37 +441,12 @@ class Receiver:
             limit (int): Maximum number of SACK blocks to return.
 
         Returns:
-            List[SackBlock]: List of SACK blocks.
+            List[SackBlock]: List of SACK blocks, highest first.
         """
-        if not self.sack_enabled:
-            return []
-        spans: List[Tuple[int, int]] = []
-        base = self.rcv_nxt
-        for s, p in self._buf.items():
-            e = s + len(p)
-            if e <= base:
-                continue
-            s = max(s, base)
-            if s < e:
-                spans.append((s, e))
-        if not spans:
+        if not self.sack_enabled or not self._asm.ranges:
             return []
-
-        spans.sort()
-        merged: List[SackBlock] = []
-        cs, ce = spans[0]
-        for s, e in spans[1:]:
-            if s <= ce:
-                ce = max(ce, e)
-            else:
-                merged.append(SackBlock(cs, ce))
-                cs, ce = s, e
-        merged.append(SackBlock(cs, ce))
-
-        merged.sort(key=lambda b: b.start, reverse=True)
-
         cap = min(limit, Packet.MAX_SACK_BLOCKS)
-        return merged[:cap]
+        return [SackBlock(s, e) for s, e in reversed(self._asm.ranges[-cap:])]
 
     def _print(self, msg: str) -> None:
         """
@@ -9,29 +9,43 @@ Classes:
 
 from __future__ import annotations
 
+import heapq
 import random
+from bisect import bisect_left, bisect_right
 from collections import deque
 from dataclasses import dataclass
-from typing import Callable, Dict, List, Optional
+from types import MappingProxyType
+from typing import (
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from utils.time import monotonic_ms
 
-from .packet import Packet
-from .types import ChannelType, PacketType
+from .packet import Packet, PacketPool
+from .types import MAX_SPAN_WINDOWS, ChannelType, PacketType, SackBlock
 
 MAXIMUM_RTO_MS = 8000
+_RNG_BITS = 32
 
 
-@dataclass
+@dataclass(slots=True)
 class _Seg:
     """
     One data segment tracked by the sender.
 
     seq:        first byte offset of this segment in the stream
     end:        one-past-last byte offset
-    payload:    the bytes to send
+    payload:    the bytes to send (a zero-copy view into the offered data)
     chan:       ChannelType used for last transmission
-    sent_ts:    last transmission monotonic timestamp (ms) or 0 if never sent
+    sent_ts:    last transmission monotonic timestamp (ms) or None if never sent
     acked:      True iff fully acknowledged (or retired for unreliable)
     retx_count: number of retransmissions already done
     rto_ms:     current RTO for this segment (ms)
@@ -39,9 +53,9 @@ class _Seg:
 
     seq: int
     end: int
-    payload: bytes
+    payload: Union[bytes, memoryview]
     chan: ChannelType = ChannelType.RELIABLE
-    sent_ts: int = 0
+    sent_ts: Optional[int] = None
     acked: bool = False
     retx_count: int = 0
     rto_ms: int = 1000
@@ -73,10 +87,16 @@ class Sender:
     Methods:
         offer(data: bytes) -> int:
             Accept data into the send buffer, segmenting as needed.
+        free_space() -> int:
+            Return how many bytes offer() would accept right now.
         due_packets() -> List[Packet]:
             Build and return packets due for sending now.
+        release_packets(pkts: List[Packet]) -> None:
+            Recycle sent packets for later due_packets() calls.
         on_feedback(pkt: Packet) -> None:
             Process incoming ACK/SACK feedback packets.
+        on_feedback_raw(typ, ack, ts_echo, sack, now, rcv_wnd) -> None:
+            Process ACK/SACK feedback given as already-parsed fields.
         inflight_bytes() -> int:
             Return the number of unacknowledged bytes currently outstanding.
         has_unacked() -> bool:
@@ -101,29 +121,51 @@ class Sender:
         self.win = int(window)
         self.now_ms = now_ms or monotonic_ms
 
-        self.prob_reliable = max(0.0, min(1.0, float(prob_reliable)))
         self.sack_enabled = bool(sack_enabled)
         self.verbose = bool(verbose)
         self._rng = rng or random.Random()
 
-        self.base_seq: Dict[ChannelType, int] = {
-            ChannelType.RELIABLE: 0,
-            ChannelType.UNRELIABLE: 0,
-        }
-        self.next_seq: Dict[ChannelType, int] = {
-            ChannelType.RELIABLE: 0,
-            ChannelType.UNRELIABLE: 0,
-        }
-        self.inflight: Dict[ChannelType, Dict[int, _Seg]] = {
-            ChannelType.RELIABLE: {},
-            ChannelType.UNRELIABLE: {},
-        }
+        # Per-channel state lives in plain attributes; see the `inflight` and
+        # `next_seq` properties for the by-ChannelType views.
+        self._next_seq_rel: int = 0
+        self._next_seq_unrel: int = 0
+        self._inflight_rel: Dict[int, _Seg] = {}
+        self._inflight_unrel: Dict[int, _Seg] = {}
+        self._inflight_view = MappingProxyType(
+            {
+                ChannelType.RELIABLE: self._inflight_rel,
+                ChannelType.UNRELIABLE: self._inflight_unrel,
+            }
+        )
         self.bytes_inflight: int = 0
+        # Recycled DATA packets; see due_packets() and release_packets().
+        self._pkt_pool = PacketPool(capacity=max(2 * self.win // max(self.mss, 1), 1))
+        self._segments_inflight_rel: int = 0  # reliable segments awaiting ACK/SACK
+        # How far reliable data may run past the lowest unacked byte: what the
+        # receiver buffers, MAX_SPAN_WINDOWS of its advertised windows. Our own
+        # window stands in until the first feedback arrives.
+        self._span_limit: int = self.win * MAX_SPAN_WINDOWS
+
+        # Sorted seqs of the reliable in-flight map (insertion order is seq order),
+        # for binary search over the segments a SACK block covers.
+        self._rel_seqs: List[int] = []
+        # sent_ts -> number of in-flight reliable segments first sent at that time
+        # and never retransmitted, i.e. the timestamps valid for RTT sampling.
+        self._ts_live: Dict[int, int] = {}
+        # Reliable segments awaiting their first transmission, in seq order.
+        self._unsent: Deque[_Seg] = deque()
+        # Min-heap of (sent_ts + rto_ms, seq) retransmission deadlines. Entries
+        # are deleted lazily: one whose segment is gone, acked or was sent again
+        # since it was pushed no longer matches and is skipped when popped.
+        self._rto_heap: List[Tuple[int, int]] = []
+
+        self.prob_reliable = prob_reliable  # see the property
 
         self.srtt: Optional[float] = None
         self.rttvar: Optional[float] = None
         self.default_rto: int = 1000
         self.min_rto: int = 200
+        self._rto_cached: Optional[int] = None  # reset by each RTT sample
 
         self.rtt_min: Optional[float] = None
         self.rtt_max: Optional[float] = None
@@ -141,12 +183,71 @@ class Sender:
         self.total_packets_received: int = 0
         self.total_bytes_sent: int = 0
 
+    @property
+    def prob_reliable(self) -> float:
+        """
+        Probability of sending a new segment over the reliable channel.
+
+        Setting it clamps the value to [0, 1] and updates the derived state.
+
+        Returns:
+            float: The probability.
+        """
+        return self._prob_reliable
+
+    @prob_reliable.setter
+    def prob_reliable(self, value: float) -> None:
+        p = max(0.0, min(1.0, float(value)))
+        self._prob_reliable = p
+        # p as a threshold on a 32-bit integer draw, which is cheaper than a
+        # float draw per segment.
+        self._prob_int = int(p * (1 << _RNG_BITS))
+        # due_packets() only visits the channels p can feed, plus any that
+        # still hold segments from before a change.
+        stages = []
+        if p < 1.0 or self._inflight_unrel:
+            stages.append(self._due_unreliable)
+        if p > 0.0 or self._inflight_rel:
+            stages.append(self._due_reliable)
+        self._due_stages = tuple(stages)
+
+    @property
+    def inflight(self) -> Mapping[ChannelType, Dict[int, _Seg]]:
+        """
+        In-flight segment maps keyed by channel.
+
+        The mapping is a read-only view built once; the per-channel maps it
+        holds are the live ones.
+
+        Returns:
+            Mapping[ChannelType, Dict[int, _Seg]]: seq -> segment, per channel.
+        """
+        return self._inflight_view
+
+    @property
+    def next_seq(self) -> Mapping[ChannelType, int]:
+        """
+        Next unassigned byte offset, per channel.
+
+        Each access returns a new read-only snapshot; it does not follow later
+        sends, and sequence numbers cannot be set through it.
+
+        Returns:
+            Mapping[ChannelType, int]: The next seq of each channel.
+        """
+        return MappingProxyType(
+            {
+                ChannelType.RELIABLE: self._next_seq_rel,
+                ChannelType.UNRELIABLE: self._next_seq_unrel,
+            }
+        )
+
     def offer(self, data: bytes) -> int:
         """
         Accept as much as fits the window, segment to MSS, enqueue into inflight.
 
         Args:
-            data (bytes): The data to offer for sending.
+            data (bytes): The data to offer for sending (any bytes-like object).
 
         Returns:
             int: The number of bytes accepted for sending.
@@ -154,63 +255,104 @@ class Sender:
         if not data:
             return 0
 
-        space = max(self.win - self.bytes_inflight, 0)
+        space = self.free_space()
         if space <= 0:
             return 0
 
         take = min(len(data), space)
-        off = 0
-        while off < take:
-            end = min(off + self.mss, take)
-            chunk = data[off:end]
-            use_rel = self._rng.random() < self.prob_reliable
-            chan = ChannelType.RELIABLE if use_rel else ChannelType.UNRELIABLE
-            seg = _Seg(
-                seq=self.next_seq[chan],
-                end=self.next_seq[chan] + len(chunk),
-                chan=chan,
-                payload=chunk,
-            )
-            self.inflight[chan][seg.seq] = seg
-            self.next_seq[chan] = seg.end
-            self.bytes_inflight += len(chunk)
-            off = end
+        # Segments hold slices of one view instead of a copy each. Only immutable
+        # input is viewed directly; anything else is copied once so the caller
+        # may reuse its buffer.
+        if not isinstance(data, bytes):
+            data = bytes(data[:take])
+        mv = memoryview(data)[:take]
+        # Probabilities 0 and 1 fix the channel without drawing at all.
+        prob_int = self._prob_int
+        fixed = None
+        if prob_int <= 0:
+            fixed = False
+        elif prob_int >= 1 << _RNG_BITS:
+            fixed = True
+        draw = self._rng.getrandbits
+        mss = self.mss
+        for off in range(0, take, mss):
+            chunk = mv[off : off + mss]
+            use_rel = draw(_RNG_BITS) < prob_int if fixed is None else fixed
+            if use_rel:
+                seq = self._next_seq_rel
+                end = seq + len(chunk)
+                seg = _Seg(seq=seq, end=end, payload=chunk)
+                self._inflight_rel[seq] = seg
+                self._rel_seqs.append(seq)
+                self._unsent.append(seg)
+                self._segments_inflight_rel += 1
+                self._next_seq_rel = end
+            else:
+                seq = self._next_seq_unrel
+                end = seq + len(chunk)
+                seg = _Seg(seq=seq, end=end, chan=ChannelType.UNRELIABLE, payload=chunk)
+                self._inflight_unrel[seq] = seg
+                self._next_seq_unrel = end
+        self.bytes_inflight += take
         return take
 
+    def free_space(self) -> int:
+        """
+        Return how many bytes offer() would accept right now.
+
+        Besides the window, reliable data must stay within MAX_SPAN_WINDOWS of
+        the receiver's advertised windows of the lowest unacked byte, which is
+        as far as the receiver buffers.
+
+        Returns:
+            int: The number of bytes that fit, never negative.
+        """
+        seqs = self._rel_seqs
+        span = self._next_seq_rel - (seqs[0] if seqs else self._next_seq_rel)
+        space = min(self.win - self.bytes_inflight, self._span_limit - span)
+        return max(space, 0)
+
     def due_packets(self) -> List[Packet]:
         """
         Build DATA packets for segments due to send now (first send or after RTO).
         New segments are randomly assigned RELIABLE/UNRELIABLE by prob_reliable.
         UNRELIABLE segments are freed immediately (no feedback expected).
 
+        Packets are drawn from an internal pool; once they are serialized they
+        may be handed back with release_packets() to be reused.
+
         Returns:
             List[Packet]: The list of packets due for sending now.
         """
         now = self.now_ms()
         out: List[Packet] = []
-        to_free: List[int] = []
+        for stage in self._due_stages:
+            stage(now, out)
+        return out
 
-        # Iterate the unreliable channel
-        for seg in self.inflight[ChannelType.UNRELIABLE].values():
-            if seg.acked:
-                continue
-            first_send = seg.sent_ts == 0
-            if first_send:
-                self.sent_unrel_segments += 1
-            else:
-                seg.retx_count += 1
-                self.retx_total += 1
-                seg.rto_ms = min(seg.rto_ms * 2, MAXIMUM_RTO_MS)
-
-            pkt = Packet(
-                typ=PacketType.DATA,
-                channel_type=seg.chan,
-                seq=seg.seq,
-                ts_send=now,
-                payload=seg.payload,
+    def _due_unreliable(self, now: int, out: List[Packet]) -> None:
+        """
+        Append packets for all queued UNRELIABLE segments and retire them.
+
+        Args:
+            now (int): Current monotonic time (ms).
+            out (List[Packet]): The list to append packets to.
+
+        Returns:
+            None
+        """
+        # Unreliable segments are sent once and retired right away
+        unrel = self._inflight_unrel
+        freed = 0
+        for seg in unrel.values():
+            self.sent_unrel_segments += 1
+            pkt = Packet.fill_data(
+                self._pkt_pool.get(), seg.seq, seg.payload, now, seg.chan
             )
             seg.sent_ts = now
+            seg.acked = True
             out.append(pkt)
+            freed += len(seg.payload)
 
             if self.start_time_ms is None:
                 self.start_time_ms = now
@@ -218,64 +360,96 @@ class Sender:
             self.total_packets_sent += 1
             self.total_bytes_sent += len(seg.payload)
 
-            seg.acked = True
-            self._print(
-                f"{'RETX' if not first_send else 'TX  '} | ch={seg.chan.name} | "
-                f"seq={seg.seq} len={len(seg.payload)} rto={seg.rto_ms}ms"
-            )
+            if self.verbose:
+                self._print(
+                    f"TX   | ch={seg.chan.name} | "
+                    f"seq={seg.seq} len={len(seg.payload)} rto={seg.rto_ms}ms"
+                )
+        if unrel:
+            unrel.clear()
+            self.bytes_inflight = max(self.bytes_inflight - freed, 0)
+
+    def _due_reliable(self, now: int, out: List[Packet]) -> None:
+        """
+        Append packets for RELIABLE segments due now: RTO expiries, then new ones.
 
-        # Iterate the reliable channel
-        for seg in sorted(
-            self.inflight[ChannelType.RELIABLE].values(), key=lambda s: s.seq
-        ):
+        Args:
+            now (int): Current monotonic time (ms).
+            out (List[Packet]): The list to append packets to.
+
+        Returns:
+            None
+        """
+        # Retransmit reliable segments whose RTO expired, earliest deadline first
+        rel = self._inflight_rel
+        heap = self._rto_heap
+        while heap and heap[0][0] <= now:
+            deadline, seq = heapq.heappop(heap)
+            seg = rel.get(seq)
+            if seg is None or seg.acked or seg.sent_ts + seg.rto_ms != deadline:
+                continue
+            if seg.retx_count == 0:
+                self._forget_ts(seg.sent_ts)
+            seg.retx_count += 1
+            self.retx_total += 1
+            seg.rto_ms = min(seg.rto_ms * 2, MAXIMUM_RTO_MS)
+            out.append(self._transmit(seg, now, first_send=False))
+
+        # Then send new reliable segments in seq order
+        unsent = self._unsent
+        while unsent:
+            seg = unsent.popleft()
             if seg.acked:
                 continue
+            self.sent_rel_segments += 1
+            self._ts_live[now] = self._ts_live.get(now, 0) + 1
+            out.append(self._transmit(seg, now, first_send=True))
 
-            first_send = seg.sent_ts == 0
-            need_send = first_send or (now - seg.sent_ts) >= seg.rto_ms
-            if not need_send:
-                continue
+    def release_packets(self, pkts: List[Packet]) -> None:
+        """
+        Return packets from due_packets() to the pool once they have been sent.
 
-            if first_send:
-                self.sent_rel_segments += 1
-            else:
-                seg.retx_count += 1
-                self.retx_total += 1
-                seg.rto_ms = min(seg.rto_ms * 2, MAXIMUM_RTO_MS)
-
-            pkt = Packet(
-                typ=PacketType.DATA,
-                channel_type=seg.chan,
-                seq=seg.seq,
-                ts_send=now,
-                payload=seg.payload,
-            )
-            seg.sent_ts = now
-            out.append(pkt)
+        The packets must not be used afterwards.
 
-            if self.start_time_ms is None:
-                self.start_time_ms = now
-            self.end_time_ms = now
-            self.total_packets_sent += 1
-            self.total_bytes_sent += len(seg.payload)
+        Args:
+            pkts (List[Packet]): Packets previously returned by due_packets().
+
+        Returns:
+            None
+        """
+        put = self._pkt_pool.put
+        for pkt in pkts:
+            put(pkt)
+
+    def _transmit(self, seg: _Seg, now: int, first_send: bool) -> Packet:
+        """
+        Stamp a reliable segment as sent at `now`, arm its RTO and build its packet.
+
+        Args:
+            seg (_Seg): The segment to (re)transmit.
+            now (int): Current monotonic time (ms).
+            first_send (bool): True for the first transmission of the segment.
+
+        Returns:
+            Packet: The DATA packet to send.
+        """
+        seg.sent_ts = now
+        heapq.heappush(self._rto_heap, (now + seg.rto_ms, seg.seq))
 
+        if self.start_time_ms is None:
+            self.start_time_ms = now
+        self.end_time_ms = now
+        self.total_packets_sent += 1
+        self.total_bytes_sent += len(seg.payload)
+
+        if self.verbose:
             self._print(
                 f"{'RETX' if not first_send else 'TX  '} | ch={seg.chan.name} | "
                 f"seq={seg.seq} len={len(seg.payload)} rto={seg.rto_ms}ms"
             )
-
-        if to_free:
-            freed = 0
-            for s in to_free:
-                freed += len(self.inflight[ChannelType.RELIABLE][s].payload)
-                del self.inflight[ChannelType.RELIABLE][s]
-            self.bytes_inflight = max(self.bytes_inflight - freed, 0)
-
-        for s in to_free:
-            freed += len(self.inflight[ChannelType.UNRELIABLE][s].payload)
-            del self.inflight[ChannelType.UNRELIABLE][s]
-
-        return out
+        return Packet.fill_data(
+            self._pkt_pool.get(), seg.seq, seg.payload, now, seg.chan
+        )
 
     def on_feedback(self, pkt: Packet) -> None:
         """
@@ -287,103 +461,187 @@ class Sender:
         Returns:
             None
         """
-        if pkt.typ not in (PacketType.ACK, PacketType.SACK):
-            return
+        self.on_feedback_raw(
+            pkt.typ, pkt.ack, pkt.ts_echo, pkt.sack, rcv_wnd=pkt.rcv_wnd
+        )
 
-        self._maybe_update_rtt(pkt.ts_echo)
+    def on_feedback_raw(
+        self,
+        typ: int,
+        ack: int,
+        ts_echo: int,
+        sack: Sequence[SackBlock],
+        now: Optional[int] = None,
+        rcv_wnd: int = 0,
+    ) -> None:
+        """
+        Process ACK/SACK feedback given as fields (see Packet.parse_feedback).
 
-        # Cumulative ACK
-        self._ack_up_to(pkt.ack)
+        Args:
+            typ (int): PacketType of the feedback; other types are ignored.
+            ack (int): Cumulative ACK number.
+            ts_echo (int): The echoed timestamp.
+            sack (Sequence[SackBlock]): SACK blocks (empty for ACK).
+            now (Optional[int]): Arrival time (ms) if the caller already read the
+                clock, e.g. once for a whole burst; read on demand otherwise.
+            rcv_wnd (int): The receiver's advertised window; 0 if not known.
 
-        # Selective ACK blocks
-        if pkt.typ == PacketType.SACK and self.sack_enabled:
-            for blk in pkt.sack:
-                self._ack_range(blk.start, blk.end)
+        Returns:
+            None
+        """
+        if typ != PacketType.ACK and typ != PacketType.SACK:
+            return
 
-        # Remove all acked segments and update byte count
-        freed = 0
-        done = [s for s in self.inflight[ChannelType.RELIABLE].values() if s.acked]
-        for seg in done:
-            freed += len(seg.payload)
-            del self.inflight[ChannelType.RELIABLE][seg.seq]
-        self.bytes_inflight = max(self.bytes_inflight - freed, 0)
+        if rcv_wnd:
+            self._span_limit = rcv_wnd * MAX_SPAN_WINDOWS
+        self._maybe_update_rtt(ts_echo, now)
 
-        self.total_packets_received += len(done)
+        # Acked segments are removed as they are found; removal is the ack.
+        self._ack_up_to(ack)
+        if typ == PacketType.SACK and self.sack_enabled:
+            self._ack_blocks(sack)
 
     def _ack_up_to(self, up_to: int) -> None:
         """
-        Mark all segments with end <= up_to as acked.
+        Retire all segments with end <= up_to.
+
+        They form a prefix of the sorted seqs; only the last segment starting at
+        or before `up_to` needs its end checked.
 
         Args:
-            up_to (int): The byte offset up to which segments should be marked as acked.
+            up_to (int): The byte offset up to which segments are acknowledged.
 
         Returns:
             None
         """
-        for seg in self.inflight[ChannelType.RELIABLE].values():
-            if seg.end <= up_to:
-                seg.acked = True
+        seqs = self._rel_seqs
+        k = bisect_right(seqs, up_to)
+        if k and self._inflight_rel[seqs[k - 1]].end > up_to:
+            k -= 1
+        if k:
+            self._retire(0, k)
+
+    def _ack_blocks(self, blocks: Sequence[SackBlock]) -> None:
+        """
+        Retire all segments that overlap any of the SACK `blocks`.
+
+        Blocks are visited in ascending order in one pass over the sorted seqs:
+        each binary search starts where the previous block stopped.
+
+        Args:
+            blocks (Sequence[SackBlock]): Half-open byte ranges [start, end).
 
-    def _ack_range(self, start: int, end: int) -> None:
+        Returns:
+            None
+        """
+        inflight = self._inflight_rel
+        seqs = self._rel_seqs
+        lo = 0
+        for start, end in sorted(blocks):
+            # The segment holding `start` (if any) is the last one beginning at or
+            # before it; segments before `lo` were settled by a lower block.
+            lo = max(bisect_right(seqs, start, lo) - 1, lo)
+            if lo < len(seqs) and inflight[seqs[lo]].end <= start:
+                lo += 1
+            hi = bisect_left(seqs, end, lo)
+            if hi > lo:
+                self._retire(lo, hi)
+
+    def _retire(self, lo: int, hi: int) -> None:
         """
-        Mark all segments that overlap [start, end) as acked.
+        Remove the acknowledged segments at positions [lo, hi) of the sorted seqs.
 
         Args:
-            start (int): The start of the byte range (inclusive).
-            end (int): The end of the byte range (exclusive).
+            lo (int): First position to remove.
+            hi (int): One past the last position to remove.
 
         Returns:
             None
         """
-        for seg in self.inflight[ChannelType.RELIABLE].values():
-            if seg.acked:
-                continue
-            if seg.seq >= end or seg.end <= start:
-                continue
+        inflight = self._inflight_rel
+        seqs = self._rel_seqs
+        freed = 0
+        for seq in seqs[lo:hi]:
+            seg = inflight.pop(seq)
             seg.acked = True
+            freed += len(seg.payload)
+            if seg.retx_count == 0 and seg.sent_ts is not None:
+                self._forget_ts(seg.sent_ts)
+        del seqs[lo:hi]
+        self.bytes_inflight = max(self.bytes_inflight - freed, 0)
+        self._segments_inflight_rel -= hi - lo
+        self.total_packets_received += hi - lo
 
-    def _maybe_update_rtt(self, ts_echo: int) -> None:
+    def _maybe_update_rtt(self, ts_echo: int, now: Optional[int] = None) -> None:
         """
         Update SRTT/RTTVAR from a clean RTT sample.
 
+        Per Karn's rule the sample is only taken if `ts_echo` is the send time of
+        an in-flight segment that was never retransmitted.
+
         Args:
             ts_echo (int): The echoed timestamp from the feedback packet.
+            now (Optional[int]): Current time (ms), or None to read the clock.
 
         Returns:
             None
         """
-        if ts_echo == 0:
+        if ts_echo == 0 or not self._ts_live.get(ts_echo):
             return
 
-        for seg in self.inflight[ChannelType.RELIABLE].values():
-            if seg.sent_ts == ts_echo and seg.retx_count == 0:
-                sample = max(self.now_ms() - ts_echo, 1)
+        if now is None:
+            now = self.now_ms()
+        sample = now - ts_echo
+        if sample < 1:
+            sample = 1
+
+        self.rtt_cnt += 1
+        self.rtt_sum += sample
+        rtt_min, rtt_max = self.rtt_min, self.rtt_max
+        if rtt_min is None or sample < rtt_min:
+            self.rtt_min = sample
+        if rtt_max is None or sample > rtt_max:
+            self.rtt_max = sample
+        self._rtt_samples.append(int(sample))
+
+        srtt = self.srtt
+        if srtt is None:
+            self.srtt = float(sample)
+            self.rttvar = sample / 2.0
+        else:
+            self.rttvar = 0.75 * self.rttvar + 0.25 * abs(srtt - sample)
+            self.srtt = 0.875 * srtt + 0.125 * sample
+        self._rto_cached = None
+
+        # Re-arm never-retransmitted segments with the new RTO and rebuild the
+        # deadline heap, which also sheds its stale entries.
+        rto = self.current_rto()
+        heap = []
+        append = heap.append
+        for s in self._inflight_rel.values():
+            if s.retx_count == 0:
+                s.rto_ms = rto
+            if s.sent_ts is not None:
+                append((s.sent_ts + s.rto_ms, s.seq))
+        heapq.heapify(heap)
+        self._rto_heap = heap
+
+    def _forget_ts(self, sent_ts: int) -> None:
+        """
+        Drop one reference to `sent_ts` as a valid RTT-sampling timestamp.
 
-                self.rtt_cnt += 1
-                self.rtt_sum += sample
-                self.rtt_min = (
-                    sample if self.rtt_min is None else min(self.rtt_min, sample)
-                )
-                self.rtt_max = (
-                    sample if self.rtt_max is None else max(self.rtt_max, sample)
-                )
-                self._rtt_samples.append(int(sample))
-
-                if self.srtt is None:
-                    self.srtt = float(sample)
-                    self.rttvar = float(sample) / 2.0
-                else:
-                    alpha, beta = 1 / 8, 1 / 4
-                    self.rttvar = (1 - beta) * self.rttvar + beta * abs(
-                        self.srtt - sample
-                    )
-                    self.srtt = (1 - alpha) * self.srtt + alpha * sample
-
-                rto = self.current_rto()
-                for s in self.inflight[ChannelType.RELIABLE].values():
-                    if s.retx_count == 0:
-                        s.rto_ms = rto
-                break
+        Args:
+            sent_ts (int): First-transmission time of a segment being acked or
+                retransmitted.
+
+        Returns:
+            None
+        """
+        left = self._ts_live[sent_ts] - 1
+        if left:
+            self._ts_live[sent_ts] = left
+        else:
+            del self._ts_live[sent_ts]
 
     def _print(self, msg: str) -> None:
         """
@@ -420,15 +678,21 @@ class Sender:
         """
         Return the sender's current RTO (ms) based on SRTT/RTTVAR.
 
+        The value only changes with a new RTT sample, so it is computed once
+        per sample and cached.
+
         Returns:
             int: The current RTO in milliseconds.
         """
-        if self.srtt is None:
-            return self.default_rto
-        var = self.rttvar or 0.0
-
-        rto = self.srtt + max(4.0 * var, 1.0)
-        return max(int(rto), self.min_rto)
+        rto = self._rto_cached
+        if rto is None:
+            if self.srtt is None:
+                rto = self.default_rto
+            else:
+                var = self.rttvar or 0.0
+                rto = max(int(self.srtt + max(4.0 * var, 1.0)), self.min_rto)
+            self._rto_cached = rto
+        return rto
 
     def metrics(self) -> dict:
         """
@@ -454,9 +718,7 @@ class Sender:
             "rtt_samples_ms_last": list(self._rtt_samples),
             "retransmits": self.retx_total,
             "inflight_bytes": self.bytes_inflight,
-            "segments_inflight": sum(
-                1 for s in self.inflight[ChannelType.RELIABLE].values() if not s.acked
-            ),
+            "segments_inflight": self._segments_inflight_rel,
             "segments_sent_reliable": self.sent_rel_segments,
             "segments_sent_unreliable": self.sent_unrel_segments,
             "total_packets_sent": self.total_packets_sent,
@@ -475,4 +737,4 @@ class Sender:
         Returns:
             List[_Seg]: The list of segments in flight.
         """
-        return list(self.inflight[ChannelType.RELIABLE].values())
+        return list(self._inflight_rel.values())
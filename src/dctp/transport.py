@@ -7,22 +7,31 @@ Classes:
 
 import select
 import socket
-from typing import Tuple
+from typing import Any, Callable, Dict, List, Sequence, Tuple
 
-from .packet import Packet
+from .packet import Packet, PacketPool
 from .receiver import Receiver
 from .sender import Sender
-from .types import PacketType
+from .types import ChannelType, PacketType
 
 DEFAULT_MTU = 1200
 DEFAULT_WINDOW = 64 * 1024 - 1
 DEFAULT_PROB_RELIABLE = 0.5
+MAX_DATAGRAM = 65535
+RECV_BATCH = 64  # datagrams drained per burst before processing
 
 
 class Transport:
     """
     A class that implements transport in DCTP.
 
+    `window` is both the send window and the advertised receive window. After
+    SACKs, reliable data may run up to MAX_SPAN_WINDOWS of the peer's windows
+    past the cumulative ACK, so the receive buffer can grow to that many times
+    `window` bytes. Before the first ACK/SACK the sender only knows its own
+    window; a peer whose window is smaller by more than that factor may drop
+    part of the first flight, which is then retransmitted.
+
     Attributes:
         mtu (int): Maximum Transmission Unit.
         verbose (bool): Verbose logging flag.
@@ -31,7 +40,7 @@ class Transport:
         receiver (Receiver): The receiver instance.
 
     Methods:
-        _on_inbound_frame(raw: bytes, src) -> None:
+        _on_inbound(raw: bytes, src) -> None:
             Process an inbound frame.
         _flush_due() -> int:
             Flush due packets from the sender.
@@ -61,11 +70,26 @@ class Transport:
 
         self._sock = None
         self._peer = None
+        self._rx_buf = bytearray(MAX_DATAGRAM)
+        self._rx_view = memoryview(self._rx_buf)
+        self._tx_buf = bytearray(Packet.BASE_LEN + Packet.MAX_PAYLOAD)
+        self._tx_view = memoryview(self._tx_buf)
+        self._pool = PacketPool()
+        # Sources of reliable data in the burst being processed, in arrival
+        # order (dict as an ordered set); each gets the burst's ACK/SACK.
+        self._fb_dsts: Dict[Any, None] = {}
+        self._burst_now = 0  # clock reading (ms) for the burst being processed
+        self._inbound_dispatch: Dict[int, Callable[[bytes, Any], None]] = {
+            PacketType.DATA: self._handle_data,
+            PacketType.ACK: self._handle_feedback,
+            PacketType.SACK: self._handle_feedback,
+        }
 
         self._bytes_tx = 0
         self._bytes_rx = 0
         self._frames_tx = 0
         self._frames_rx = 0
+        self._frames_bad = 0
         self._acks_tx = 0
         self._acks_rx = 0
         self._sacks_tx = 0
@@ -116,6 +140,32 @@ class Transport:
         self._flush_due()
         return n
 
+    def send_batch(self, chunks: Sequence[bytes]) -> int:
+        """
+        Queue several messages and flush them together.
+
+        Messages are queued in order until one does not fit in what the sender
+        can accept (see Sender.free_space()); that message and the rest are
+        left to the caller.
+
+        Args:
+            chunks (Sequence[bytes]): The messages to send.
+
+        Returns:
+            int: The number of messages queued.
+        """
+        sender = self.sender
+        queued = 0
+        for data in chunks:
+            # offer() takes everything within free_space(), so a message that
+            # passes the check is never split.
+            n = len(data)
+            if n > sender.free_space() or sender.offer(data) < n:
+                break
+            queued += 1
+        self._flush_due()
+        return queued
+
     def recv(self, max_bytes: int) -> bytes:
         """
         Receive data from the transport.
@@ -126,7 +176,7 @@ class Transport:
         Returns:
             bytes: The received data.
         """
-        return self.receiver.pop_deliverable()[:max_bytes]
+        return self.receiver.pop_deliverable(max_bytes)
 
     def poll(self, timeout_ms: int) -> None:
         """
@@ -145,13 +195,21 @@ class Transport:
         if not r:
             return
         while True:
-            try:
-                raw, src = self._sock.recvfrom(65535)
-            except (BlockingIOError, InterruptedError):
+            burst = self._recv_burst()
+            # Feedback in one burst arrived together; timestamp it once.
+            self._burst_now = self.sender.now_ms()
+            for raw, src in burst:
+                self._bytes_rx += len(raw)
+                self._frames_rx += 1
+                try:
+                    self._on_inbound(raw, src)
+                except ValueError:
+                    # A corrupt frame (bad checksum or length) is dropped on
+                    # its own; the rest of the burst is still processed.
+                    self._frames_bad += 1
+            self._send_feedback()
+            if len(burst) < RECV_BATCH:
                 break
-            self._bytes_rx += len(raw)
-            self._frames_rx += 1
-            self._on_inbound(raw, src)
         self._flush_due()
 
     def drain(self) -> None:
@@ -182,6 +240,7 @@ class Transport:
             "bytes_rx": self._bytes_rx,
             "frames_tx": self._frames_tx,
             "frames_rx": self._frames_rx,
+            "frames_bad": self._frames_bad,
             "acks_tx": self._acks_tx,
             "acks_rx": self._acks_rx,
             "sacks_tx": self._sacks_tx,
@@ -200,39 +259,6 @@ class Transport:
 
         return base
 
-    def _on_inbound_frame(self, raw: bytes, src):
-        """
-        Process an inbound frame.
-
-        Args:
-            raw (bytes): The raw bytes of the inbound frame.
-            src: The source address of the inbound frame.
-
-        Returns:
-            None
-        """
-        pkt = Packet.from_bytes(raw)
-
-        if self._peer is None and pkt.typ == PacketType.DATA:
-            self._peer = src
-            if self.verbose:
-                print(f"[dctp] learned peer = {src}")
-
-        if pkt.typ == PacketType.DATA:
-            fb = self.receiver.on_data(pkt)
-            if fb is not None:
-                self._send_pkt(fb, dst=src)
-                if fb.typ == PacketType.ACK:
-                    self._acks_tx += 1
-                elif fb.typ == PacketType.SACK:
-                    self._sacks_tx += 1
-        elif pkt.typ in (PacketType.ACK, PacketType.SACK):
-            self.sender.on_feedback(pkt)
-            if pkt.typ == PacketType.ACK:
-                self._acks_rx += 1
-            else:
-                self._sacks_rx += 1
-
     def _flush_due(self) -> int:
         """
         Flush due packets from the sender.
@@ -242,11 +268,43 @@ class Transport:
         """
         if not self._sock or not self._peer:
             return 0
-        cnt = 0
-        for pkt in self.sender.due_packets():
-            self._send_pkt(pkt, dst=self._peer)
-            cnt += 1
-        return cnt
+        # DATA frames are serialized one after another into the same buffer.
+        # Python's socket module has no sendmmsg(2), so each frame is its own
+        # sendto(); the lookups are hoisted out of the loop instead.
+        pkts = self.sender.due_packets()
+        if not pkts:
+            return 0
+        buf, view, peer = self._tx_buf, self._tx_view, self._peer
+        sendto = self._sock.sendto
+        sent = 0
+        for pkt in pkts:
+            n = pkt.pack_into(buf)
+            sendto(view[:n], peer)
+            sent += n
+        self._bytes_tx += sent
+        self._frames_tx += len(pkts)
+        self.sender.release_packets(pkts)
+        return len(pkts)
+
+    def _recv_burst(self) -> List[Tuple[bytes, Tuple[str, int]]]:
+        """
+        Drain up to RECV_BATCH pending datagrams from the socket.
+
+        Datagrams are read into one preallocated buffer, so each read copies only
+        the bytes actually received instead of allocating a 64 KiB buffer.
+
+        Returns:
+            List[Tuple[bytes, Tuple[str, int]]]: (frame, source address) pairs.
+        """
+        assert self._sock is not None
+        burst = []
+        for _ in range(RECV_BATCH):
+            try:
+                n, src = self._sock.recvfrom_into(self._rx_buf)
+            except (BlockingIOError, InterruptedError):
+                break
+            burst.append((bytes(self._rx_view[:n]), src))
+        return burst
 
     def _ensure_socket(self) -> None:
         """
@@ -280,7 +338,7 @@ class Transport:
 
     def _on_inbound(self, raw: bytes, src) -> None:
         """
-        Process an inbound packet.
+        Process an inbound packet, dispatching on its type byte before parsing.
 
         Args:
             raw (bytes): The raw bytes of the inbound packet.
@@ -289,24 +347,74 @@ class Transport:
         Returns:
             None
         """
-        pkt = Packet.from_bytes(raw)
+        handler = self._inbound_dispatch.get(raw[0]) if raw else None
+        if handler is not None:
+            handler(raw, src)
 
-        if self._peer is None and pkt.typ == PacketType.DATA:
-            self._peer = src
-            if self.verbose:
-                print(f"[dctp] learned peer = {src}")
-
-        if pkt.typ == PacketType.DATA:
-            fb = self.receiver.on_data(pkt)
-            if fb is not None:
-                self._send_pkt(fb, dst=src)
-                if fb.typ == PacketType.ACK:
-                    self._acks_tx += 1
-                elif fb.typ == PacketType.SACK:
-                    self._sacks_tx += 1
-        elif pkt.typ in (PacketType.ACK, PacketType.SACK):
-            self.sender.on_feedback(pkt)
-            if pkt.typ == PacketType.ACK:
-                self._acks_rx += 1
-            else:
-                self._sacks_rx += 1
+    def _handle_data(self, raw: bytes, src) -> None:
+        """
+        Parse a DATA frame into a pooled Packet and hand it to the receiver.
+
+        Args:
+            raw (bytes): The inbound DATA frame.
+            src: The source address of the frame.
+
+        Returns:
+            None
+        """
+        pkt = Packet.fill_from_bytes(self._pool.get(), raw)
+        try:
+            # Only a frame that parsed cleanly may teach us the peer.
+            if self._peer is None:
+                self._peer = src
+                if self.verbose:
+                    print(f"[dctp] learned peer = {src}")
+
+            # Feedback is cumulative, so one ACK/SACK answers the whole burst;
+            # see _send_feedback(). Unreliable data is never acknowledged.
+            self.receiver.ingest(pkt)
+            if pkt.channel_type == ChannelType.RELIABLE:
+                self._fb_dsts[src] = None
+        finally:
+            # Nothing downstream keeps the packet: payloads are copied out.
+            self._pool.put(pkt)
+
+    def _handle_feedback(self, raw: bytes, src) -> None:
+        """
+        Hand an ACK/SACK frame to the sender without building a Packet.
+
+        Args:
+            raw (bytes): The inbound ACK or SACK frame.
+            src: The source address of the frame.
+
+        Returns:
+            None
+        """
+        typ, ack, rcv_wnd, ts_echo, sack = Packet.parse_feedback(raw)
+        self.sender.on_feedback_raw(typ, ack, ts_echo, sack, self._burst_now, rcv_wnd)
+        if typ == PacketType.ACK:
+            self._acks_rx += 1
+        else:
+            self._sacks_rx += 1
+
+    def _send_feedback(self) -> None:
+        """
+        Send one ACK/SACK for the reliable data of the burst just processed to
+        each source that sent some.
+
+        It carries the newest cumulative ack and SACK blocks, so it stands in
+        for one feedback frame per DATA frame.
+
+        Returns:
+            None
+        """
+        fb = self.receiver.drain_ack()
+        if fb is None:
+            return
+        for dst in self._fb_dsts:
+            self._send_pkt(fb, dst=dst)
+            if fb.typ == PacketType.ACK:
+                self._acks_tx += 1
+            elif fb.typ == PacketType.SACK:
+                self._sacks_tx += 1
+        self._fb_dsts.clear()
@@ -5,6 +5,10 @@ Classes:
     PacketType: Enumeration of DCTP packet types.
     Flag: Enumeration of bit flags used in DCTP packets.
     SackBlock: Named tuple representing a SACK block as a byte range.
+
+Constants:
+    MAX_SPAN_WINDOWS: How many windows reliable data may run past the
+        cumulative ACK.
 """
 
 from __future__ import annotations
@@ -12,6 +16,12 @@ from __future__ import annotations
 from enum import IntEnum
 from typing import NamedTuple
 
+# SACKed bytes free the sender's window while lower gaps are still open, so
+# reliable data can run well past the cumulative ACK. The sender stops at this
+# many of the receiver's advertised windows past its lowest unacked byte, and
+# the receiver buffers that far: its ring can grow to this many windows.
+MAX_SPAN_WINDOWS = 16
+
 
 class PacketType(IntEnum):
     """Frame type carried in the first byte of the base header."""
@@ -4,12 +4,16 @@ A module providing a monotonic clock in milliseconds.
 
 import time
 
+_monotonic_ns = time.monotonic_ns
+
 
 def monotonic_ms() -> int:
     """
     Monotonic clock in milliseconds
 
+    Uses integer nanoseconds so no float multiply or int cast is needed.
+
     Returns:
         int: The current monotonic time in milliseconds.
     """
-    return int(time.monotonic() * 1000)
+    return _monotonic_ns() // 1_000_000
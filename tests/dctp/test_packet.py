@@ -7,7 +7,16 @@ import struct
 
 import pytest
 
-from dctp.packet import ACK_LEN, BASE_FMT, BASE_LEN, MAX_PAYLOAD, SACK_HDR_LEN, Packet
+from dctp.packet import (
+    ACK_LEN,
+    BASE_FMT,
+    BASE_LEN,
+    MAX_PAYLOAD,
+    SACK_HDR_LEN,
+    Packet,
+    PacketPool,
+    _checksum,
+)
 from dctp.types import ChannelType, PacketType, SackBlock
 
 
@@ -113,3 +122,135 @@ def test_length_mismatch_detected():
     tampered = bytes(bad_base) + bytes(raw[BASE_LEN:])
     with pytest.raises(ValueError, match="length mismatch"):
         Packet.from_bytes(tampered)
+
+
+def test_checksum_matches_wordwise_reference():
+    """Test that the checksum equals a word-by-word one's complement sum."""
+
+    def reference(b: bytes) -> int:
+        total = 0
+        if len(b) % 2 == 1:
+            b += b"\x00"
+        for i in range(0, len(b), 2):
+            total += (b[i] << 8) | b[i + 1]
+            total = (total & 0xFFFF) + (total >> 16)
+        return (~total) & 0xFFFF
+
+    samples = [b"", b"\x00" * 8, b"\xff" * 8, b"\xff\xff\x00", b"\x01"]
+    samples += [os.urandom(n) for n in (1, 2, 15, 16, 17, 1400, BASE_LEN + MAX_PAYLOAD)]
+    for b in samples:
+        assert _checksum(b) == reference(b)
+
+
+def test_reject_out_of_range_fields():
+    """Test that header fields wider than their wire width are rejected."""
+    for kwargs in ({"seq": 1 << 32}, {"ts_send": -1}):
+        p = Packet(
+            typ=PacketType.DATA,
+            channel_type=ChannelType.RELIABLE,
+            **{"seq": 0, "ts_send": 0, **kwargs},
+        )
+        with pytest.raises(ValueError, match="out of range"):
+            _ = p.to_bytes()
+
+    p = Packet(
+        typ=PacketType.ACK,
+        channel_type=ChannelType.RELIABLE,
+        seq=0,
+        ts_send=0,
+        ack=1,
+        rcv_wnd=1 << 16,
+    )
+    with pytest.raises(ValueError, match="out of range"):
+        _ = p.to_bytes()
+
+
+def test_pool_recycles_packets_and_fill_overwrites_fields():
+    """Test that pooled packets are reused and fully refilled from a frame."""
+    sack = Packet(
+        typ=PacketType.SACK,
+        channel_type=ChannelType.RELIABLE,
+        seq=5,
+        ts_send=6,
+        ack=7,
+        rcv_wnd=8,
+        ts_echo=9,
+        sack=[SackBlock(10, 20)],
+    )
+    data = Packet(
+        typ=PacketType.DATA,
+        channel_type=ChannelType.RELIABLE,
+        seq=1,
+        ts_send=2,
+        payload=b"hello",
+    )
+
+    pool = PacketPool(capacity=1)
+    first = Packet.fill_from_bytes(pool.get(), sack.to_bytes())
+    assert first == sack
+    pool.put(first)
+
+    second = Packet.fill_from_bytes(pool.get(), data.to_bytes())
+    assert second is first
+    assert second == data
+
+
+def test_pack_into_matches_to_bytes():
+    """Test that serializing a DATA packet into a reused buffer matches to_bytes."""
+    buf = bytearray(BASE_LEN + MAX_PAYLOAD)
+    for size in (0, 1, 7, MAX_PAYLOAD):
+        p = Packet(
+            typ=PacketType.DATA,
+            channel_type=ChannelType.RELIABLE,
+            seq=42,
+            ts_send=43,
+            payload=os.urandom(size),
+        )
+        n = p.pack_into(buf)
+        assert buf[:n] == p.to_bytes()
+
+
+def test_parse_feedback_matches_from_bytes():
+    """Test that the feedback fast path yields the fields from_bytes would."""
+    for blocks in ([], [SackBlock(3000, 4000), SackBlock(4500, 5000)]):
+        p = Packet(
+            typ=PacketType.SACK if blocks else PacketType.ACK,
+            channel_type=ChannelType.RELIABLE,
+            seq=1000,
+            ts_send=0,
+            ack=2000,
+            rcv_wnd=2048,
+            ts_echo=444,
+            sack=blocks,
+        )
+        raw = p.to_bytes()
+        typ, ack, rcv_wnd, ts_echo, sack = Packet.parse_feedback(raw)
+        assert (typ, ack, rcv_wnd, ts_echo) == (p.typ, 2000, 2048, 444)
+        assert list(sack) == blocks
+        assert list(Packet.from_bytes(raw).sack) == blocks
+
+    data = Packet(
+        typ=PacketType.DATA, channel_type=ChannelType.RELIABLE, seq=1, ts_send=2
+    )
+    with pytest.raises(ValueError):
+        Packet.parse_feedback(data.to_bytes())
+
+
+def test_factories_match_keyword_construction():
+    """Test that data_of/ack_of build the same packets as the full constructor."""
+    assert Packet.data_of(5, b"xy", ts_send=7) == Packet(
+        typ=PacketType.DATA,
+        channel_type=ChannelType.RELIABLE,
+        seq=5,
+        ts_send=7,
+        payload=b"xy",
+    )
+    assert Packet.ack_of(100, ts_echo=3, rcv_wnd=9) == Packet(
+        typ=PacketType.ACK,
+        channel_type=ChannelType.RELIABLE,
+        seq=100,
+        ts_send=0,
+        ack=100,
+        rcv_wnd=9,
+        ts_echo=3,
+    )
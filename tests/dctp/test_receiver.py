@@ -3,8 +3,9 @@ A module to unit test the Receiver class in dctp.receiver.
 """
 
 from dctp.packet import Packet
-from dctp.receiver import Receiver
-from dctp.types import ChannelType, PacketType
+from dctp.receiver import MAX_SACK_REPORT, Receiver
+from dctp.sender import Sender
+from dctp.types import MAX_SPAN_WINDOWS, ChannelType, PacketType, SackBlock
 
 
 def mk_data(
@@ -21,9 +22,7 @@ def mk_data(
     Returns:
         Packet: The created DATA packet.
     """
-    return Packet(
-        typ=PacketType.DATA, channel_type=channel_type, seq=seq, ts_send=111, payload=s
-    )
+    return Packet.data_of(seq, s, ts_send=111, channel_type=channel_type)
 
 
 def test_unreliable_channel_data_is_ignored() -> None:
@@ -84,3 +83,119 @@ def test_duplicate_below_rcvnxt_is_ignored() -> None:
     ack = r.on_data(mk_data(0, b"AAA"))
     assert ack.ack == 6
     assert r.pop_deliverable() == b""
+
+
+def test_reassembly_wraps_around_the_window() -> None:
+    """
+    Test that reordered data is reassembled across the end of the ring, that
+    the ring grows for data past the window, and that bytes beyond what the
+    sender may have outstanding are dropped.
+
+    Returns:
+        None
+    """
+    r = Receiver(rcv_nxt=0, wnd_bytes=8)
+    r.on_data(mk_data(0, b"012345"))
+    assert r.pop_deliverable() == b"012345"
+
+    a1 = r.on_data(mk_data(7, b"789"))
+    assert a1.sack == [SackBlock(7, 10)]
+
+    a2 = r.on_data(mk_data(13, b"DEFGH"))
+    assert a2.sack == [SackBlock(13, 18), SackBlock(7, 10)]
+
+    a3 = r.on_data(mk_data(6 + 8 * MAX_SPAN_WINDOWS, b"!"))
+    assert a3.sack == [SackBlock(13, 18), SackBlock(7, 10)]
+
+    r.on_data(mk_data(10, b"ABC"))
+    a4 = r.on_data(mk_data(6, b"6"))
+    assert a4.ack == 18
+    assert r.pop_deliverable() == b"6789ABCDEFGH"
+
+
+def test_segments_sent_after_a_sack_frees_the_window_are_accepted() -> None:
+    """
+    Test that data the sender may send once SACKed bytes free its window is
+    buffered even though it lies past rcv_nxt + wnd_bytes.
+
+    Returns:
+        None
+    """
+    clock = [1]
+    s = Sender(mss=100, window=300, now_ms=lambda: clock[0])
+    r = Receiver(rcv_nxt=0, wnd_bytes=300)
+    payload = bytes(range(250)) * 2
+
+    s.offer(payload[:300])
+    lost, *rest = s.due_packets()
+    for p in rest:
+        s.on_feedback(r.on_data(p))
+    assert s.inflight_bytes() == 100
+
+    assert s.offer(payload[300:]) == 200
+    for p in s.due_packets():
+        s.on_feedback(r.on_data(p))
+    assert r.on_data(mk_data(lost.seq, bytes(lost.payload))).ack == 500
+    assert r.pop_deliverable() == payload
+
+
+def test_reordered_burst_with_many_gaps_needs_no_retransmission() -> None:
+    """
+    Test that a burst opening more gaps than one SACK can report is still
+    buffered in full, so the sender never has to retransmit any of it.
+
+    Returns:
+        None
+    """
+    clock = [1]
+    s = Sender(mss=10, window=1000, now_ms=lambda: clock[0])
+    r = Receiver(rcv_nxt=0)
+    s.offer(bytes(range(100)))
+    pkts = {
+        p.seq: Packet.data_of(p.seq, bytes(p.payload), p.ts_send)
+        for p in s.due_packets()
+    }
+
+    for seq in (10, 30, 50, 70, 90, 0, 20, 40, 60, 80):
+        fb = r.on_data(pkts[seq])
+        if fb.typ == PacketType.SACK:
+            assert len(fb.sack) <= MAX_SACK_REPORT
+        s.on_feedback(fb)
+
+    assert r.pop_deliverable() == bytes(range(100))
+    clock[0] += 60_000
+    assert s.due_packets() == []
+    assert s.retx_total == 0
+
+
+def test_ingest_coalesces_feedback_until_drained() -> None:
+    """
+    Test that ingesting several segments yields a single cumulative ACK.
+
+    Returns:
+        None
+    """
+    r = Receiver(rcv_nxt=0)
+    assert r.drain_ack() is None
+    for seq, s in ((0, b"AB"), (4, b"EF"), (2, b"CD")):
+        r.ingest(mk_data(seq, s))
+    ack = r.drain_ack()
+    assert ack.typ == PacketType.ACK
+    assert ack.ack == 6
+    assert r.drain_ack() is None
+    assert r.pop_deliverable() == b"ABCDEF"
+
+
+def test_pop_deliverable_keeps_the_remainder() -> None:
+    """
+    Test that a bounded pop leaves undelivered bytes queued in order.
+
+    Returns:
+        None
+    """
+    r = Receiver(rcv_nxt=0)
+    r.on_data(mk_data(0, b"ABCDEF"))
+    assert r.pop_deliverable(4) == b"ABCD"
+    r.on_data(mk_data(6, b"GH"))
+    assert r.pop_deliverable(0) == b""
+    assert r.pop_deliverable() == b"EFGH"
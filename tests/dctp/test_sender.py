@@ -4,9 +4,11 @@ A module to unit test the Sender class in dctp.sender.
 
 import time
 
+import pytest
+
 from dctp.packet import Packet
 from dctp.sender import Sender
-from dctp.types import ChannelType, PacketType, SackBlock
+from dctp.types import MAX_SPAN_WINDOWS, ChannelType, PacketType, SackBlock
 
 
 def fake_clock() -> int:
@@ -16,7 +18,7 @@ def fake_clock() -> int:
     Returns:
         int: The current monotonic time in milliseconds.
     """
-    return int(time.monotonic() * 1000)
+    return time.monotonic_ns() // 1_000_000
 
 
 def test_offer_and_first_send() -> None:
@@ -48,17 +50,7 @@ def test_ack_marks_acked_and_slides_window() -> None:
     s.offer(b"A" * 200)
     _ = s.due_packets()
 
-    a = Packet(
-        typ=PacketType.ACK,
-        channel_type=ChannelType.RELIABLE,
-        seq=0,
-        ts_send=0,
-        ack=100,
-        rcv_wnd=0,
-        ts_echo=0,
-        payload=b"",
-    )
-    s.on_feedback(a)
+    s.on_feedback(Packet.ack_of(100))
 
     accepted = s.offer(b"B" * 100)
     assert accepted == 100
@@ -95,3 +87,235 @@ def test_sack_marks_higher_ranges() -> None:
             assert seg.acked
         else:
             assert not seg.acked
+
+
+def test_offer_copies_mutable_buffers() -> None:
+    """
+    Test that segments do not alias a bytearray the caller goes on to reuse.
+
+    Returns:
+        None
+    """
+    s = Sender(mss=4, window=100, now_ms=fake_clock)
+    buf = bytearray(b"ABCDEFGH")
+    assert s.offer(buf) == 8
+    buf[:] = b"XXXXXXXX"
+
+    out = s.due_packets()
+    assert b"".join(bytes(p.payload) for p in out) == b"ABCDEFGH"
+
+
+def test_unreliable_segments_release_the_window() -> None:
+    """
+    Test that unreliable segments leave the in-flight map once sent.
+
+    Returns:
+        None
+    """
+    s = Sender(mss=100, window=200, now_ms=fake_clock, prob_reliable=0.0)
+    assert s.offer(b"A" * 200) == 200
+    assert s.offer(b"B") == 0
+
+    out = s.due_packets()
+    assert [p.channel_type for p in out] == [ChannelType.UNRELIABLE] * 2
+    assert not s.inflight[ChannelType.UNRELIABLE]
+    assert s.inflight_bytes() == 0
+    assert s.offer(b"B" * 200) == 200
+
+
+def test_released_packets_are_reused() -> None:
+    """
+    Test that packets handed back via release_packets() are refilled later.
+
+    Returns:
+        None
+    """
+    s = Sender(mss=100, window=1000, now_ms=fake_clock, prob_reliable=1.0)
+    s.offer(b"A" * 100)
+    first = s.due_packets()
+    s.release_packets(first)
+
+    s.offer(b"B" * 100)
+    second = s.due_packets()
+    assert second[0] is first[0]
+    assert (second[0].seq, bytes(second[0].payload)) == (100, b"B" * 100)
+
+
+def test_rto_retransmits_with_exponential_backoff() -> None:
+    """
+    Test that an unacked segment is resent when its RTO expires and that each
+    retransmission doubles the RTO.
+
+    Returns:
+        None
+    """
+    clock = [1]
+    s = Sender(mss=100, window=100, now_ms=lambda: clock[0])
+    s.offer(b"A" * 100)
+    assert len(s.due_packets()) == 1
+
+    for deadline in (1001, 3001, 7001):
+        clock[0] = deadline - 1
+        assert s.due_packets() == []
+        clock[0] = deadline
+        assert [p.seq for p in s.due_packets()] == [0]
+    assert s.retx_total == 3
+
+
+def test_segment_first_sent_at_time_zero_is_retransmitted() -> None:
+    """
+    Test that a segment sent when the clock reads 0 keeps its RTO after an RTT
+    sample rebuilds the retransmission schedule.
+
+    Returns:
+        None
+    """
+    clock = [0]
+    s = Sender(mss=100, window=200, now_ms=lambda: clock[0])
+    s.offer(b"A" * 100)
+    s.due_packets()  # seq 0 is lost
+    clock[0] = 5
+    s.offer(b"B" * 100)
+    s.due_packets()
+
+    sack = Packet.ack_of(0, ts_echo=5)
+    sack.typ = PacketType.SACK
+    sack.sack = [SackBlock(100, 200)]
+    clock[0] = 20
+    s.on_feedback(sack)
+    assert s.rtt_cnt == 1
+
+    clock[0] = 100_000
+    assert [p.seq for p in s.due_packets()] == [0]
+
+
+def test_rtt_timestamps_are_released_when_segments_leave() -> None:
+    """
+    Test that acked and retransmitted segments no longer count as valid RTT
+    sampling points, including ones first sent at time 0.
+
+    Returns:
+        None
+    """
+    clock = [0]
+    s = Sender(mss=100, window=300, now_ms=lambda: clock[0])
+    s.offer(b"Z" * 100)
+    s.due_packets()
+    s.on_feedback(Packet.ack_of(100))
+    assert s._ts_live == {}
+
+    s.offer(b"A" * 200)
+    s.due_packets()
+    clock[0] = 1000
+    s.offer(b"B" * 100)
+    assert [p.seq for p in s.due_packets()] == [100, 200, 300]
+    assert s._ts_live == {1000: 1}
+
+    s.on_feedback(Packet.ack_of(200, ts_echo=0))
+    assert s.rtt_cnt == 0
+    s.on_feedback(Packet.ack_of(400))
+    assert s._ts_live == {}
+    assert s.get_inflight_segments() == []
+
+
+def test_current_rto_is_cached_until_the_next_rtt_sample() -> None:
+    """
+    Test that the RTO is recomputed only after a new RTT sample arrives.
+
+    Returns:
+        None
+    """
+    clock = [10]
+    s = Sender(mss=100, window=300, now_ms=lambda: clock[0])
+    assert s.current_rto() == s.default_rto
+
+    s.offer(b"A" * 100)
+    s.due_packets()
+    clock[0] = 310
+    s.on_feedback(Packet.ack_of(100, ts_echo=10))
+    assert s.current_rto() == 300 + 4 * 150
+
+    s.srtt = 1.0  # not a sample: the cached value stands
+    assert s.current_rto() == 900
+
+
+def test_offer_stops_at_the_reassembly_span() -> None:
+    """
+    Test that SACKs free the window only until reliable data reaches
+    MAX_SPAN_WINDOWS windows past the lowest unacked byte.
+
+    Returns:
+        None
+    """
+    s = Sender(mss=100, window=200, now_ms=fake_clock)
+    limit = 200 * MAX_SPAN_WINDOWS
+    while s.offer(b"A" * 100):
+        s.due_packets()
+        top = s.next_seq[ChannelType.RELIABLE]
+        sack = Packet.ack_of(0)
+        sack.typ = PacketType.SACK
+        sack.sack = [SackBlock(100, top)]
+        s.on_feedback(sack)
+    assert s.next_seq[ChannelType.RELIABLE] == limit
+    assert s.inflight_bytes() == 100
+
+
+def test_span_limit_follows_the_advertised_receive_window() -> None:
+    """
+    Test that the span limit is taken from the peer's advertised window
+    rather than the sender's own once feedback has arrived.
+
+    Returns:
+        None
+    """
+    for rcv_wnd in (50, 400):
+        s = Sender(mss=50, window=200, now_ms=fake_clock)
+        while s.offer(b"A" * 50):
+            s.due_packets()
+            sack = Packet.ack_of(0, rcv_wnd=rcv_wnd)
+            sack.typ = PacketType.SACK
+            sack.sack = [SackBlock(50, s.next_seq[ChannelType.RELIABLE])]
+            s.on_feedback(sack)
+        assert s.next_seq[ChannelType.RELIABLE] == rcv_wnd * MAX_SPAN_WINDOWS
+
+
+def test_changing_prob_reliable_takes_effect() -> None:
+    """
+    Test that setting prob_reliable after construction reroutes new segments
+    while segments already in flight are still retransmitted.
+
+    Returns:
+        None
+    """
+    clock = [1]
+    s = Sender(mss=100, window=300, now_ms=lambda: clock[0], prob_reliable=1.0)
+    s.offer(b"A" * 100)
+    s.due_packets()
+
+    s.prob_reliable = 7
+    assert s.prob_reliable == 1.0
+    s.prob_reliable = 0.0
+    s.offer(b"B" * 100)
+    out = s.due_packets()
+    assert [p.channel_type for p in out] == [ChannelType.UNRELIABLE]
+
+    clock[0] += 1000
+    assert [p.seq for p in s.due_packets()] == [0]
+
+
+def test_per_channel_views_are_read_only() -> None:
+    """
+    Test that writes through next_seq and inflight fail loudly instead of
+    being lost.
+
+    Returns:
+        None
+    """
+    s = Sender(mss=100, window=300, now_ms=fake_clock)
+    s.offer(b"A" * 100)
+    assert s.inflight is s.inflight
+    assert list(s.inflight[ChannelType.RELIABLE]) == [0]
+    with pytest.raises(TypeError):
+        s.next_seq[ChannelType.RELIABLE] = 0
+    with pytest.raises(TypeError):
+        s.inflight[ChannelType.RELIABLE] = {}
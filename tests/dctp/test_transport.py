@@ -0,0 +1,53 @@
+"""
+A module to unit test the Transport class in dctp.transport.
+"""
+
+import pytest
+
+from dctp.packet import Packet
+from dctp.transport import Transport
+from dctp.types import MAX_SPAN_WINDOWS, ChannelType, PacketType, SackBlock
+
+
+def test_send_batch_stops_at_the_span_limit() -> None:
+    """
+    Test that send_batch does not count messages the sender cannot take
+    because the reliable span is full, even though the window has room.
+
+    Returns:
+        None
+    """
+    t = Transport(window=200, prob_reliable=1.0)
+    s = t.sender
+    limit = 200 * MAX_SPAN_WINDOWS
+    s.offer(b"A" * 50)
+    while s.next_seq[ChannelType.RELIABLE] < limit:
+        s.offer(b"A" * 100)
+        s.due_packets()
+        sack = Packet.ack_of(0)
+        sack.typ = PacketType.SACK
+        sack.sack = [SackBlock(50, s.next_seq[ChannelType.RELIABLE])]
+        s.on_feedback(sack)
+    assert s.inflight_bytes() == 50
+    assert s.next_seq[ChannelType.RELIABLE] == limit
+
+    assert t.send_batch([b"B" * 50, b"C" * 50]) == 0
+    assert s.next_seq[ChannelType.RELIABLE] == limit
+
+
+def test_peer_is_learned_only_from_valid_data_frames() -> None:
+    """
+    Test that a corrupt frame that looks like DATA does not set the peer.
+
+    Returns:
+        None
+    """
+    t = Transport()
+    junk = bytearray(Packet.data_of(0, b"abc").to_bytes())
+    junk[-1] ^= 0x01
+    with pytest.raises(ValueError):
+        t._on_inbound(bytes(junk), ("10.0.0.1", 1))
+    assert t._peer is None
+
+    t._on_inbound(Packet.data_of(0, b"abc").to_bytes(), ("10.0.0.2", 2))
+    assert t._peer == ("10.0.0.2", 2)